@@ -0,0 +1,5 @@
+""" Benchmarks of the random-header-generator package. They are not part of the distribution,
+    and they are run from the root of the repository as modules, e.g.:
+
+    python -m benchmarks.iter_headers
+"""
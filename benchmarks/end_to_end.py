@@ -0,0 +1,176 @@
+""" End-to-end benchmark of the HeaderGenerator. For each combination of user agent source
+    (program / file), http version (1 / 2), cookies (with / without) and inputs (random / fixed
+    browser, device and country), it measures the construction time of the generator, and
+    the throughput, p50 / p99 latency and peak memory allocated per call of __call__().
+    As the generator and its data are cached per process, each combination runs in a separate process.
+
+    The results are emitted as JSON. With --baseline, they are compared against a stored run, and
+    the script exits with an error if any metric regressed by more than the tolerance.
+"""
+
+from typing   import Dict, List
+import subprocess
+import itertools
+import argparse
+import platform
+import json
+import sys
+import os
+
+
+CORPUS  = os.path.join(os.path.dirname(__file__), 'data', 'corpus.txt')
+FIXED   = {'browser': 'chrome', 'device': 'desktop', 'country': 'us'} # Fixed inputs
+COOKIES = {'session_id': 'a1b2c3d4e5', 'theme': 'dark'}               # Cookies (if any)
+
+# Metrics compared with the baseline, and whether higher values are better
+METRICS = {'construction_s': False, 'headers_per_s': True, 'p50_us': False, 'p99_us': False, 'peak_bytes_per_call': False}
+
+
+def configs() -> List[Dict]:
+    """ Returns all combinations of the benchmark """
+
+    return [
+        {'user_agents': userAgents, 'http_version': httpVersion, 'cookies': cookies, 'inputs': inputs}
+        for userAgents, httpVersion, cookies, inputs in itertools.product(
+            ('program', 'file'), (1, 2), (False, True), ('random', 'fixed')
+        )
+    ]
+
+
+def configName(config: Dict) -> str:
+    """ Returns the name of a combination, e.g. program/http1/no-cookies/random """
+
+    cookies = 'cookies' if config['cookies'] else 'no-cookies'
+    return f"{config['user_agents']}/http{config['http_version']}/{cookies}/{config['inputs']}"
+
+
+def percentile(sortedValues: List[float], q: float) -> float:
+    """ Returns the q-th percentile (0 <= q <= 100) of sorted values (nearest rank) """
+
+    index = max(0, min(len(sortedValues) - 1, round(q / 100 * len(sortedValues)) - 1))
+    return sortedValues[index]
+
+
+def worker(config: Dict, num: int, seed: int) -> Dict:
+    """ Runs a single combination (in a separate process). """
+
+    import warnings
+    import tracemalloc
+    import random
+    import time
+
+    from random_header_generator import HeaderGenerator
+
+    warnings.simplefilter('ignore') # Import and overwrite warnings
+    random.seed(seed)
+
+    start = time.perf_counter()
+    if config['user_agents'] == 'file': generator = HeaderGenerator(user_agents = 'file', filename = CORPUS)
+    else                              : generator = HeaderGenerator(user_agents = 'program')
+
+    construction = time.perf_counter() - start
+
+    kwargs = {'httpVersion': config['http_version'], 'cookies': COOKIES if config['cookies'] else {}}
+    if config['inputs'] == 'fixed': kwargs.update(FIXED)
+
+    for _ in range(min(num, 1000)): generator(**kwargs) # Warm-up
+
+    latencies = []
+    clock     = time.perf_counter
+    start     = clock()
+
+    for _ in range(num):
+        t0 = clock()
+        generator(**kwargs)
+        latencies.append(clock() - t0)
+
+    total = clock() - start
+    latencies.sort()
+
+    # Peak memory allocated per call (tracked separately, as tracing slows down the execution)
+    tracemalloc.start()
+    peaks, calls = 0, min(num, 1000)
+    for _ in range(calls):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        generator(**kwargs)
+        peaks += tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+
+    return {
+        'construction_s'     : round(construction, 4),
+        'headers_per_s'      : round(num / total),
+        'p50_us'             : round(percentile(latencies, 50) * 1e6, 2),
+        'p99_us'             : round(percentile(latencies, 99) * 1e6, 2),
+        'peak_bytes_per_call': round(peaks / calls),
+    }
+
+
+def run(config: Dict, num: int, seed: int) -> Dict:
+    """ Runs a combination in a separate process and returns its results """
+
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    args = [sys.executable, '-m', 'benchmarks.end_to_end', '--worker', json.dumps(config), '--num', str(num), '--seed', str(seed)]
+    out  = subprocess.run(args, cwd = root, capture_output = True, text = True, check = True)
+
+    return json.loads(out.stdout)
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """ Compares the results against a baseline. Returns the regressions (if any) """
+
+    regressions = []
+    for name, metrics in results['results'].items():
+
+        reference = baseline.get('results', {}).get(name)
+        if reference is None: continue
+
+        for metric, higherIsBetter in METRICS.items():
+            new, old = metrics.get(metric), reference.get(metric)
+            if not new or not old: continue
+
+            change    = (new - old) / old
+            regressed = change < -tolerance if higherIsBetter else change > tolerance
+
+            print(f'{name:<35} {metric:<20} {old:>12} -> {new:>12} ({change:+7.1%}){"  REGRESSION" if regressed else ""}')
+            if regressed: regressions.append(f'{name}: {metric}')
+
+    return regressions
+
+
+def main():
+
+    argParser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    argParser.add_argument('-n', '--num',       type = int,   default = 5000, help = 'Number of calls per combination')
+    argParser.add_argument('-s', '--seed',      type = int,   default = 42,   help = 'Seed of the random generator')
+    argParser.add_argument('-o', '--output',    type = str,   default = None, help = 'Output JSON file (printed if omitted)')
+    argParser.add_argument('-b', '--baseline',  type = str,   default = None, help = 'Baseline JSON file to compare against')
+    argParser.add_argument('-t', '--tolerance', type = float, default = 0.2,  help = 'Relative change tolerated before a regression')
+    argParser.add_argument('--worker',          type = str,   default = None, help = argparse.SUPPRESS)
+    args = argParser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(json.loads(args.worker), args.num, args.seed)))
+        return
+
+    results = {
+        'meta'   : {'num': args.num, 'seed': args.seed, 'python': platform.python_version()},
+        'results': {configName(config): run(config, args.num, args.seed) for config in configs()},
+    }
+
+    output = json.dumps(results, indent = 2)
+    if args.output:
+        with open(args.output, 'w', encoding = 'utf-8') as f: f.write(output + '\n')
+    elif not args.baseline:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding = 'utf-8') as f: baseline = json.load(f)
+
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions: sys.exit(f'{len(regressions)} regression(s): ' + ', '.join(regressions))
+
+    return
+
+
+if __name__ == '__main__': main()
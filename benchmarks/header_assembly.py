@@ -0,0 +1,131 @@
+""" Benchmark of the final header assembly, i.e. the removal of incompatible headers, the conversion 
+    of the names for the http version and the ordering of the headers. The compiled compatibility 
+    and order tables of HeaderGenerator are compared against the step-by-step assembly on the raw
+    tables (reproduced below). It reports the time and the peak memory allocated per assembly.
+"""
+
+from random_header_generator       import HeaderGenerator
+from random_header_generator.utils import readFile
+from collections                   import OrderedDict
+from typing                        import Callable, List
+import argparse
+import tracemalloc
+import time
+
+
+class LegacyAssembly():
+    """ Step-by-step assembly of the headers on the raw compatibility and order tables. """
+
+    def __init__(self):
+
+        self.compTable   = readFile('header_compatibility.json')
+        self.headerOrder = readFile('header_order.json')
+
+        return
+
+
+    def __call__(self, headers: dict, browser: str, device: str, browserVer: float, httpVersion: int) -> OrderedDict:
+
+        # Remove incompatible headers
+        compatibleTab = self.compTable[f'{browser}-{device}']
+        headers       = {hName: hValue for hName, hValue in headers.items() if browserVer >= compatibleTab[hName]}
+
+        # Make compatible to the http version
+        if httpVersion == 2: headers = {k.lower(): v for k, v in headers.items()}
+
+        # Order
+        if httpVersion == 1: orderedHeaderNames = self.headerOrder["http version 1.x"][browser]
+        else               : orderedHeaderNames = self.headerOrder["http version 2.x"][browser]
+
+        headersOrdered = OrderedDict()
+        for hName in orderedHeaderNames:
+            if hName in headers: headersOrdered[hName] = headers.pop(hName)
+
+        for hName, hValue in headers.items(): headersOrdered[hName] = hValue
+
+        return headersOrdered
+
+
+def capture(generator: HeaderGenerator, num: int) -> List[tuple]:
+    """ Captures the inputs of the header assembly for <num> calls of the generator (on both http versions). """
+
+    samples, lookup, assemble = [], generator._lookup, generator._assemble
+
+    def _lookup(browser, device, browserVer, httpVersion):
+        samples.append((browser, device, browserVer, httpVersion))
+        return lookup(browser, device, browserVer, httpVersion)
+
+    def _assemble(headers, template, others):
+        samples[-1] = (dict(headers), ) + samples[-1]
+        return assemble(headers, template, others)
+
+    generator._lookup, generator._assemble = _lookup, _assemble
+
+    try:
+        for i in range(num): generator(httpVersion = 1 + i % 2)
+
+    finally: 
+        del generator._lookup, generator._assemble
+
+    return samples
+
+
+def measure(name: str, func: Callable, samples: List[tuple]):
+    """ Times <func> on all samples (best of 5 runs), and tracks the peak memory per call on a separate run. """
+
+    total = float('inf')
+    for _ in range(5): # Best of 5 runs
+        start = time.perf_counter()
+        for sample in samples: func(*sample)
+        total = min(total, time.perf_counter() - start)
+
+    peaks = []
+    tracemalloc.start()
+    for sample in samples:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        out       = func(*sample)
+        _, peak   = tracemalloc.get_traced_memory()
+        peaks.append(peak - before)
+        del out
+
+    tracemalloc.stop()
+
+    print(f'{name:<30}: {total / len(samples) * 1e6:>6.2f} us/call, peak memory {sum(peaks) / len(peaks):>7.0f} bytes/call')
+
+    return
+
+
+def main():
+
+    argParser = argparse.ArgumentParser(description = __doc__)
+    argParser.add_argument('-n', '--num', type = int, default = 5000, help = 'Number of header sets to assemble')
+    args = argParser.parse_args()
+
+    generator = HeaderGenerator()
+    samples   = capture(generator, args.num)
+    legacy    = LegacyAssembly()
+
+    def compiled(headers, browser, device, browserVer, httpVersion):
+        compatible       = generator.compatible(browser, device, browserVer)
+        template, others = generator.headerOrder(browser, httpVersion, compatible)
+        return generator._assemble(headers, template, others)
+
+    def compiledShared(headers, browser, device, browserVer, httpVersion):
+        _, template, others = generator._lookup(browser, device, browserVer, httpVersion)
+        return generator._assemble(headers, template, others)
+
+    # Check that all approaches produce the same headers
+    for sample in samples:
+        expected = legacy(*sample)
+        assert list(compiled(*sample).items())       == list(expected.items())
+        assert list(compiledShared(*sample).items()) == list(expected.items())
+
+    measure('legacy',                    legacy,         samples)
+    measure('compiled',                  compiled,       samples)
+    measure('compiled (shared lookups)', compiledShared, samples)
+
+    return
+
+
+if __name__ == '__main__': main()
@@ -0,0 +1,91 @@
+""" Benchmark of the import time of the package. The import is repeated in fresh processes with 
+    python -X importtime, and the report of the best run is emitted as JSON: the wall-clock and
+    cumulative import time of the module, and the modules with the highest self and cumulative times.
+    Checks also that the scraping dependencies (bs4, requests) are not imported.
+"""
+
+from typing import Dict, List, Tuple
+import subprocess
+import argparse
+import platform
+import json
+import time
+import sys
+import os
+
+
+MODULE = 'random_header_generator.header_generator' # Module whose import is measured
+LAZY   = ('bs4', 'requests')                        # Modules that must not be imported
+
+
+def importTime(module: str) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """ Imports a module in a fresh process. Returns the wall-clock time (in seconds) of the 
+        process, and the (module, self [us], cumulative [us]) times reported by -X importtime.
+    """
+
+    root  = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    start = time.perf_counter()
+    out   = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'], 
+        cwd = root, capture_output = True, text = True, check = True
+    )
+    wall  = time.perf_counter() - start
+
+    # Lines are formatted as: "import time: <self [us]> | <cumulative [us]> | <indentation><module>"
+    # A module may be reported more than once (e.g. as a parent package and a submodule).
+    modules = {}
+    for line in out.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line: continue
+        self_, cumulative, name = line[len('import time:'):].split('|')
+        name = name.strip()
+        if int(cumulative) > modules.get(name, (0, -1))[1]: modules[name] = (int(self_), int(cumulative))
+
+    return wall, [(name, self_, cumulative) for name, (self_, cumulative) in modules.items()]
+
+
+def report(module: str, wall: float, modules: List[Tuple[str, int, int]], top: int) -> Dict:
+    """ Summarises the import times of a run """
+
+    total   = {name: cumulative for name, _, cumulative in modules}.get(module)
+    bySelf  = sorted(modules, key = lambda m: m[1], reverse = True)[:top]
+    byTotal = sorted(modules, key = lambda m: m[2], reverse = True)[:top]
+
+    return {
+        'wall_ms'       : round(wall * 1e3, 1),
+        'cumulative_ms' : round(total / 1e3, 1) if total is not None else None,
+        'modules'       : len(modules),
+        'lazy_imported' : sorted(name for name, _, _ in modules if name in LAZY),
+        'top_self'      : [{'module': name, 'us': self_}      for name, self_, _      in bySelf],
+        'top_cumulative': [{'module': name, 'us': cumulative} for name, _, cumulative in byTotal],
+    }
+
+
+def main():
+
+    argParser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    argParser.add_argument('-m', '--module',  type = str, default = MODULE, help = 'Module to import')
+    argParser.add_argument('-r', '--repeats', type = int, default = 5,      help = 'Number of imports (the fastest one is kept)')
+    argParser.add_argument('-t', '--top',     type = int, default = 10,     help = 'Number of slowest modules reported')
+    argParser.add_argument('-o', '--output',  type = str, default = None,   help = 'Output JSON file (printed if omitted)')
+    args = argParser.parse_args()
+
+    runs    = [importTime(args.module) for _ in range(args.repeats)]
+    best    = min(runs, key = lambda run: run[0])
+    results = {
+        'meta'  : {'module': args.module, 'repeats': args.repeats, 'python': platform.python_version()},
+        'import': report(args.module, *best, args.top),
+    }
+
+    output = json.dumps(results, indent = 2)
+    if args.output:
+        with open(args.output, 'w', encoding = 'utf-8') as f: f.write(output + '\n')
+    else:
+        print(output)
+
+    lazy = results['import']['lazy_imported']
+    if lazy: sys.exit(f'Modules imported eagerly: {", ".join(lazy)}')
+
+    return
+
+
+if __name__ == '__main__': main()
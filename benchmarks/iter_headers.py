@@ -0,0 +1,58 @@
+""" Benchmark of the streaming header iterator (HeaderGenerator.iter_headers) against
+    repeated calls of the generator. It reports the throughput (headers per second) 
+    and the peak memory allocated while consuming the headers of each approach.
+"""
+
+from random_header_generator import HeaderGenerator
+from typing                  import Callable, Iterable
+import argparse
+import tracemalloc
+import time
+
+
+def consume(headers: Iterable) -> int:
+    """ Consumes (and discards) the headers of an iterable, as a crawler would. """
+
+    count = 0
+    for _ in headers: count += 1
+
+    return count
+
+
+def measure(name: str, func: Callable[[], Iterable], num: int):
+    """ Times the consumption of the headers returned by <func>. The peak memory 
+        is tracked on a separate run, as tracing slows down the execution.
+    """
+
+    start = time.perf_counter()
+    count = consume(func())
+    total = time.perf_counter() - start
+
+    tracemalloc.start()
+    consume(func())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert count == num, f'{name}: {count} headers generated instead of {num}.'
+    print(f'{name:<15}: {num / total:>10.0f} headers/s, peak memory {peak / 1024:>10.1f} KiB')
+
+    return
+
+
+def main():
+
+    argParser = argparse.ArgumentParser(description = __doc__)
+    argParser.add_argument('-n', '--num', type = int, default = 20000, help = 'Number of headers to generate')
+    args = argParser.parse_args()
+    num  = args.num
+
+    generator = HeaderGenerator()
+
+    measure('loop of calls',  lambda: (generator() for _ in range(num)), num)
+    measure('iter_headers',   lambda: generator.iter_headers(limit = num), num)
+    measure('generate_many',  lambda: generator.generate_many(num), num)
+
+    return
+
+
+if __name__ == '__main__': main()
@@ -0,0 +1,45 @@
+""" A/B benchmark of the regex engines of the user agent parser (see ua_parser/parser.py).
+    For each generic parser, it checks that the 'sequential' and 'combined' engines give
+    the same results over a corpus of user agents, and reports the time per user agent
+    of each, as well as the time needed to build the parsers.
+"""
+
+from random_header_generator.ua_parser.parser import parserFactory
+from random_header_generator.definitions      import PARSERS, ENGINES
+from .regex_prefilter                         import makeCorpus
+from .timing                                  import timeit
+import argparse
+import random
+import time
+
+
+def main():
+
+    argParser = argparse.ArgumentParser(description = __doc__)
+    argParser.add_argument('-n', '--num',  type = int, default = 20,   help = 'Number of generated user agents per OS and browser')
+    argParser.add_argument('-f', '--file', type = str, default = None, help = 'File of user agents (one per line)')
+    argParser.add_argument('-s', '--seed', type = int, default = 42,   help = 'Seed of the user agent generator')
+    args = argParser.parse_args()
+
+    random.seed(args.seed)
+    corpus = makeCorpus(args.num, args.file)
+
+    parsers = {}
+    for engine in ENGINES:
+        start = time.perf_counter()
+        parsers[engine] = {name: parserFactory(name, engine) for name in PARSERS}
+        print(f'{engine:<10}: parsers built in {(time.perf_counter() - start) * 1e3:>7.1f} ms')
+
+    print(f'{len(corpus)} user agents')
+    for name in PARSERS:
+
+        results = {engine: [parsers[engine][name](userAgent) for userAgent in corpus] for engine in ENGINES}
+        assert all(results[engine] == results[ENGINES[0]] for engine in ENGINES), f'{name}: the engines disagree.'
+
+        timings = ', '.join(f'{engine} {timeit(parsers[engine][name], corpus, repeats = 3):>7.1f} us/agent' for engine in ENGINES)
+        print(f'{name:<8}: {timings}')
+
+    return
+
+
+if __name__ == '__main__': main()
@@ -0,0 +1,141 @@
+""" Benchmark suite of the user agent parser (see ua_parser/parser.py), over the pinned corpus of
+    benchmarks/data/corpus.txt (desktop and mobile user agents of all browsers, long-tail devices,
+    bots and garbage strings). It measures:
+    * the throughput of each generic parser (browser, cpu, device, engine, os) and of a full parse,
+    * the worst-case user agents, i.e. the ones that fall through the whole DEVICE list,
+    * a full parse with a cold and a warm cache,
+    * the memory retained by, and allocated during, each parse.
+    The results are emitted as JSON, so that changes of the parser can be compared on numbers.
+"""
+
+from random_header_generator.ua_parser        import Parser
+from random_header_generator.ua_parser.parser import GenericParser
+from random_header_generator.definitions      import PARSERS, ENGINES
+from .timing                                  import timeit
+from typing                                   import List
+import argparse
+import platform
+import tracemalloc
+import json
+import time
+import os
+
+
+CORPUS = os.path.join(os.path.dirname(__file__), 'data', 'corpus.txt')
+
+
+def readCorpus(pathToFile: str) -> List[str]:
+    """ Reads the user agents of a corpus file (one per line) """
+
+    with open(pathToFile, encoding = 'utf-8') as f: return [line.rstrip('\n') for line in f if line.strip()]
+
+
+def throughput(usPerAgent: float) -> dict:
+    """ Formats a time per user agent """
+
+    return {'us_per_agent': round(usPerAgent, 2), 'agents_per_s': round(1e6 / usPerAgent)}
+
+
+def perParser(parser: Parser, corpus: List[str], repeats: int) -> dict:
+    """ Throughput of each generic parser, and of a full parse """
+
+    results = {name: throughput(timeit(parser.parsers[name], corpus, repeats)) for name in PARSERS}
+    results['full'] = throughput(timeit(lambda userAgent: parser(userAgent).record(), corpus, repeats))
+
+    return results
+
+
+def worstCase(parser: Parser, corpus: List[str], repeats: int, top: int = 5) -> dict:
+    """ Throughput of the device parser over the user agents that it does not match, and the
+        user agents with the slowest full parse.
+    """
+
+    device: GenericParser = parser.parsers['device']
+    unmatched = [userAgent for userAgent in corpus if device._getMatch(userAgent)[0] is None]
+
+    timings = sorted(
+        ((timeit(lambda userAgent: parser(userAgent).record(), [userAgent], repeats), userAgent) for userAgent in corpus),
+        reverse = True
+    )
+
+    return {
+        'device_unmatched'   : len(unmatched),
+        'device_unmatched_us': round(timeit(device, unmatched, repeats), 2) if unmatched else None,
+        'device_all_us'      : round(timeit(device, corpus, repeats), 2),
+        'slowest'            : [{'us': round(us, 2), 'user_agent': userAgent[:200]} for us, userAgent in timings[:top]],
+    }
+
+
+def cache(parser: Parser, corpus: List[str], repeats: int) -> dict:
+    """ Full parse with a cold and a warm cache (large enough for the whole corpus) """
+
+    parse = lambda userAgent: parser(userAgent).record()
+    parser.enableCache(len(corpus))
+
+    start = time.perf_counter()
+    for userAgent in corpus: parse(userAgent)
+    cold = (time.perf_counter() - start) / len(corpus) * 1e6
+
+    warm = timeit(parse, corpus, repeats)
+    parser.disableCache()
+
+    return {'cold': throughput(cold), 'warm': throughput(warm)}
+
+
+def memory(parser: Parser, corpus: List[str]) -> dict:
+    """ Memory retained by the records of the whole corpus, and average peak memory of a full parse """
+
+    tracemalloc.start()
+    records  = [parser(userAgent).record() for userAgent in corpus]
+    retained = tracemalloc.get_traced_memory()[0]
+
+    peaks = 0
+    for userAgent in corpus:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        parser(userAgent).record()
+        peaks += tracemalloc.get_traced_memory()[1] - base
+
+    tracemalloc.stop()
+    del records
+
+    return {'retained_bytes_per_record': round(retained / len(corpus)), 'peak_bytes_per_parse': round(peaks / len(corpus))}
+
+
+def main():
+
+    argParser = argparse.ArgumentParser(description = __doc__, formatter_class = argparse.RawDescriptionHelpFormatter)
+    argParser.add_argument('-c', '--corpus',  type = str, default = CORPUS,       help = 'File of user agents (one per line)')
+    argParser.add_argument('-e', '--engine',  type = str, default = 'sequential', help = 'Regex engine of the parser', choices = ENGINES)
+    argParser.add_argument('-r', '--repeats', type = int, default = 5,            help = 'Number of repeats (the best one is kept)')
+    argParser.add_argument('-o', '--output',  type = str, default = None,         help = 'Output JSON file (printed if omitted)')
+    args = argParser.parse_args()
+
+    corpus = readCorpus(args.corpus)
+    parser = Parser(args.engine)
+    parser.disableCache()
+
+    results = {
+        'meta': {
+            'corpus' : os.path.basename(args.corpus),
+            'agents' : len(corpus),
+            'engine' : args.engine,
+            'repeats': args.repeats,
+            'python' : platform.python_version(),
+        },
+        'parsers'   : perParser(parser, corpus, args.repeats),
+        'worst_case': worstCase(parser, corpus, args.repeats),
+        'cache'     : cache(parser, corpus, args.repeats),
+        'memory'    : memory(parser, corpus),
+    }
+
+    output = json.dumps(results, indent = 2)
+    if args.output:
+        with open(args.output, 'w', encoding = 'utf-8') as f: f.write(output + '\n')
+    else:
+        print(output)
+
+    return
+
+
+if __name__ == '__main__': main()
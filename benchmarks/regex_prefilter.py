@@ -0,0 +1,80 @@
+""" Benchmark of the literal prefilter of the user agent parser (see ua_parser/parser.py).
+    For each generic parser, it compares the sequential search of the regex list against
+    the prefiltered search over a corpus of user agents, checks that both find the same
+    regexes, and reports the time per user agent and the number of regexes tried.
+"""
+
+from random_header_generator.ua_parser.parser import Parser, GenericParser
+from random_header_generator.ua_generator     import helpers
+from random_header_generator.definitions      import PARSERS
+from .timing                                  import timeit
+from typing                                   import List, Tuple
+import argparse
+import random
+
+
+def makeCorpus(num: int, pathToFile: str = None) -> List[str]:
+    """ Returns the user agents of a .txt file (one per line), or those made by the default
+        generator of the package (<num> per operating system and browser combination).
+    """
+
+    if pathToFile: return list(helpers.getAgent('file', filename = pathToFile))
+    return list(helpers.getAgent('program', limit = num))
+
+
+def sequential(parser: GenericParser, userAgent: str) -> Tuple[int, int]:
+    """ Returns the index of the first matching regex and the number of regexes tried, without prefiltering. """
+
+    for i, dict_ in enumerate(parser.regexes):
+        if dict_['regex'].search(userAgent): return i, i + 1
+
+    return -1, len(parser.regexes)
+
+
+def prefiltered(parser: GenericParser, userAgent: str) -> Tuple[int, int]:
+    """ Returns the index of the first matching regex and the number of regexes tried, with prefiltering. """
+
+    tried = 0
+    for i in parser.prefilter(userAgent):
+        tried += 1
+        if parser.regexes[i]['regex'].search(userAgent): return i, tried
+
+    return -1, tried
+
+
+def main():
+
+    argParser = argparse.ArgumentParser(description = __doc__)
+    argParser.add_argument('-n', '--num',  type = int, default = 100,  help = 'Number of generated user agents per OS and browser')
+    argParser.add_argument('-f', '--file', type = str, default = None, help = 'File of user agents (one per line)')
+    argParser.add_argument('-s', '--seed', type = int, default = 42,   help = 'Seed of the user agent generator')
+    args = argParser.parse_args()
+
+    random.seed(args.seed)
+    corpus = makeCorpus(args.num, args.file)
+    parser = Parser()
+
+    print(f'{len(corpus)} user agents')
+    for name in PARSERS:
+
+        generic = parser.parsers[name]
+        if generic.prefilter is None:
+            print(f'{name:<8}: prefilter disabled')
+            continue
+
+        before = [sequential(generic, userAgent)  for userAgent in corpus]
+        after  = [prefiltered(generic, userAgent) for userAgent in corpus]
+        assert [i for i, _ in before] == [i for i, _ in after], f'{name}: the prefilter changed the matches.'
+
+        triedBefore = sum(tried for _, tried in before) / len(corpus)
+        triedAfter  = sum(tried for _, tried in after)  / len(corpus)
+
+        print(
+            f'{name:<8}: sequential {timeit(lambda userAgent: sequential(generic, userAgent), corpus):>7.1f} us/agent ({triedBefore:>5.1f} regexes), '
+            f'prefiltered {timeit(lambda userAgent: prefiltered(generic, userAgent), corpus):>7.1f} us/agent ({triedAfter:>5.1f} regexes)'
+        )
+
+    return
+
+
+if __name__ == '__main__': main()
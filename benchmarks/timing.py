@@ -0,0 +1,16 @@
+""" Timing helpers shared by the benchmarks """
+
+from typing import Callable, List
+import time
+
+
+def timeit(func: Callable[[str], object], corpus: List[str], repeats: int = 5) -> float:
+    """ Returns the best time (over all repeats) per user agent in microseconds. """
+
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for userAgent in corpus: func(userAgent)
+        best = min(best, time.perf_counter() - start)
+
+    return best / len(corpus) * 1e6
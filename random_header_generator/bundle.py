@@ -0,0 +1,34 @@
+""" Build step of the compiled data bundle (see utils.loadBundle()). The contents of all data files 
+    are serialised in a single pickle file, which is faster to load than parsing the json files one 
+    by one. The bundle holds a checksum of the data files it was built from, and it is ignored if any 
+    of them changes (in which case the data files are read directly).
+
+    Build (or rebuild) the bundle with:
+        python -m random_header_generator.bundle
+"""
+
+from .utils import BUNDLE, BUNDLE_VERSION, dataFiles, dataChecksum, parseFile
+import pickle
+import os
+
+
+def build(pathToFile: str = BUNDLE) -> str:
+    """ Builds the bundle from the data files. Returns the path of the bundle. 
+        Each data file is pickled separately, so that every read returns a new object. 
+    """
+
+    bundle = {
+        'version' : BUNDLE_VERSION,
+        'checksum': dataChecksum(),
+        'files'   : {name: pickle.dumps(parseFile(name), protocol = pickle.HIGHEST_PROTOCOL) for name in dataFiles()},
+    }
+
+    # Write to a temporary file first, so that concurrent readers never see a partial bundle
+    tmpFile = f'{pathToFile}.{os.getpid()}.tmp'
+    with open(tmpFile, mode = 'wb') as f: pickle.dump(bundle, f, protocol = pickle.HIGHEST_PROTOCOL)
+    os.replace(tmpFile, pathToFile)
+
+    return pathToFile
+
+
+if __name__ == '__main__': print(f'Bundle written to {build()}')
@@ -7,6 +7,7 @@ GENERATOR_TYPE      = Literal['scrape', 'program', 'file']                    #
 INPUT_TYPE          = Literal['browser', 'device', 'country']                 # Input names expected by the user
 BROWSER_TYPE        = Literal['chrome', 'edge', 'firefox', 'safari', 'opera'] # Available browsers
 PARSER_TYPE         = Literal['browser', 'cpu', 'device', 'engine', 'os']     # Parser types (names) used in parser.py, generator.py
+ENGINE_TYPE         = Literal['sequential', 'combined']                       # Regex engines of the parsers (see parser.py)
 DEVICE_TYPE         = Literal['desktop', 'mobile']                            # Available device types
 COUNTRY_TYPE        = Literal[                                                # Availabel countries' A2 - codes
     'ad', 'ae', 'af', 'ag', 'al', 'am', 'ao', 'ar', 'as', 'at', 'au', 'az', 
@@ -44,4 +45,5 @@ HTTP_VERSIONS   = get_args(HTTP_VERSION_TYPE)
 DEVICES         = get_args(DEVICE_TYPE)
 COUNTRIES       = get_args(COUNTRY_TYPE)
 BROWSERS        = get_args(BROWSER_TYPE)
-PARSERS         = get_args(PARSER_TYPE)
\ No newline at end of file
+PARSERS         = get_args(PARSER_TYPE)
+ENGINES         = get_args(ENGINE_TYPE)
\ No newline at end of file
@@ -2,21 +2,48 @@
 
 from .ua_parser    import Parser
 from collections   import OrderedDict
-from typing        import Dict, Union, Any
-from .ua_generator import CHParser, Generator as UAGenerator
+from bisect        import bisect_right
+from typing        import Dict, List, Tuple, Union, Any, Iterator, Callable
+from .ua_generator import AgentRecord, Generator as UAGenerator
 from .             import definitions as defs
 from .             import utils
+from .             import registry
 import random      as rd
 import warnings
 
 
-class Accept():
+class Accept(metaclass = utils.InstanceCache):
     """ Generator of the 'Accept' header """
 
     def __init__(self, pathToFile: str):
-        """ Initialisation method. Reads necessary data. """
+        """ Initialisation method. Reads necessary data and makes the index of each browser. """
+
+        data      = registry.load(pathToFile)
+        self.data = {name: self._makeIndex(list_) for name, list_ in data.items()}
+        self.memo = {} # Header values per browser and version
+
+        return
+
+
+    @staticmethod
+    def _makeIndex(
+        list_: List[Dict[str, Any]] # version-from and -to numbers [integers] and header contents
+        ) -> Tuple[List[float], List[Union[str, None]]]:
+        """ Makes an interval index for the versions of a browser, i.e. the sorted version boundaries,
+            and the header value for the version range starting at each boundary (None if not supported).
+            In case of overlaps, the value of the first range in the list applies.
+        """
+
+        bounds = sorted({dict_[key] for dict_ in list_ for key in ("version_from", "version_to")})
+        values = [None] # Versions before the first boundary
+        
+        for bound in bounds:
+            values.append(next(
+                (dict_["header"] for dict_ in list_ if bound >= dict_["version_from"] and bound < dict_["version_to"]), None
+            ))
+
+        return bounds, values
 
-        self.data = utils.readFile(pathToFile)
 
     def __call__(self, 
         name    : str,  # Browser name
@@ -24,39 +51,43 @@ class Accept():
         ) -> str:
         """ Generate a randomized Accept Encoding header. """
 
-        # Get header values corresponding to this browser, i.e.
-        # a list of version-from and -to numbers [integers] and header contents
-        list_ = self.data[name]
+        header = self.memo.get((name, version))
+
+        if header is None:
 
-        # Loop over the list and get the header value according to the version range
-        for dict_ in list_:
-            if version >= dict_["version_from"] and version < dict_["version_to"]:
-                return dict_["header"]
+            # Get the header value according to the version range
+            bounds, values = self.data[name]
+            header         = values[bisect_right(bounds, version)]
         
-        # If this point is reached, the version was not found
-        raise ValueError(f'{name} browser version {version} is not supported for the "Accept" header')
+            # If the version was not found, it is not supported
+            if header is None:
+                raise ValueError(f'{name} browser version {version} is not supported for the "Accept" header')
 
+            self.memo[name, version] = header
 
-class Referrer():
+        return header
+
+
+class Referrer(metaclass = utils.InstanceCache):
     """ Generator of the 'Referer' header """
 
     def __init__(self, pathToFile: str):
         """ Initialisation method. Reads necessary data. """
 
-        data = utils.readFile(pathToFile)
+        data = registry.load(pathToFile)
         self.data = {key: dict_['referers'] for key, dict_  in data.items()}
     
 
     def __call__(self, key: str) -> str: return rd.choice(self.data[key])
 
 
-class AcceptEncoding():
+class AcceptEncoding(metaclass = utils.InstanceCache):
     """ Generator of the 'Accept-Encoding' header """
 
     def __init__(self, pathToFile: str):
         """ Initialisation method. Reads necessary data. """
 
-        data = utils.readFile(pathToFile)
+        data = registry.load(pathToFile)
         self.data = data["Accept-Encoding"]
 
         return 
@@ -84,13 +115,13 @@ class AcceptEncoding():
         return ", ".join(encoders)
 
 
-class AcceptLanguage():
+class AcceptLanguage(metaclass = utils.InstanceCache):
     """ Generator of the 'Accept-Language' header """
 
     def __init__(self, pathToFile: str):
         """ Initialisation method. Reads necessary data. """
 
-        data = utils.readFile(pathToFile)
+        data = registry.load(pathToFile)
         self.data = {key: value['languages'] for key, value in data.items()}
 
         return
@@ -111,76 +142,196 @@ class AcceptLanguage():
         return ",".join(locales)
 
 
-class Selector():
+class Compatibility(metaclass = utils.InstanceCache):
+    """ Header-browser-version compatibility tables. The tables are compiled to the 
+        (sorted) versions at which the set of headers supported by a browser changes.
+    """
+
+    def __init__(self, pathToFile: str):
+        """ Initialisation method. Reads and compiles the compatibility tables. """
+
+        data      = registry.load(pathToFile)
+        self.data = {}
+
+        # Table keys are formatted as '<browser>-<device>', and contain the header names (keys) 
+        # and the version (values) for which <browser> first supported each header
+        for key, table in data.items():
+            
+            browser, device = key.split('-')
+            versions        = sorted(set(table.values())) # Versions at which headers become supported
+            headerSets      = [frozenset()]                 # Supported headers before the first version
+            
+            for version in versions:
+                headerSets.append(frozenset(hName for hName, minVersion in table.items() if minVersion <= version))
+
+            self.data[browser, device] = (versions, headerSets)
+
+        # Names of all headers that appear in the tables
+        self.headerNames = frozenset(hName for table in data.values() for hName in table)
+
+        return
+
+
+    def __call__(self, 
+        browser    : defs.BROWSER_TYPE, # browser name
+        device     : defs.DEVICE_TYPE,  # device type
+        browserVer : float,             # browser version
+        ) -> frozenset:
+        """ Returns the names of the headers supported by a browser (and version) and device """
+
+        versions, headerSets = self.data[browser, device]
+
+        return headerSets[bisect_right(versions, browserVer)]
+
+
+class HeaderOrder(metaclass = utils.InstanceCache):
+    """ Browser-based header order. The order of each browser and http version is compiled 
+        to a template, i.e. a tuple of (header name, output header name) pairs, with the output 
+        header names being lowercased for HTTP/2.
+    """
+
+    VERSION_KEYS = {1: "http version 1.x", 2: "http version 2.x"} # Keys of the order tables per http version
+
+    def __init__(self, 
+        pathToFile  : str,         # File containing the order tables
+        headerNames : frozenset,   # Names of all headers that can be generated
+        ):
+        """ Initialisation method. Reads and compiles the order tables. """
+
+        data      = registry.load(pathToFile)
+        self.data = {}
+
+        for httpVersion, versionKey in self.VERSION_KEYS.items():
+
+            # Map from the names appearing in the tables of this http version to the header names.
+            outNames = {self.name(hName, httpVersion): hName for hName in headerNames}
+
+            for browser, orderedHeaderNames in data[versionKey].items():
+
+                # Headers that are never generated (e.g. 'te') are dropped from the template
+                template = []
+                for outName in orderedHeaderNames:
+                    hName = outNames.get(outName)
+                    if hName and (hName, outName) not in template: template.append((hName, outName))
+
+                self.data[browser, httpVersion] = tuple(template)
+
+        self.templates = {} # Templates restricted to sets of compatible headers (see __call__)
+
+        return
+
+
+    @staticmethod
+    def name(hName: str, httpVersion: defs.HTTP_VERSION_TYPE) -> str:
+        """ Returns the name of a header for the given http version, i.e. it
+            lowercases the header name for HTTP/2.
+        """
+
+        return hName.lower() if httpVersion == 2 else hName
+
+
+    def __call__(self, 
+        browser     : defs.BROWSER_TYPE,      # browser name
+        httpVersion : defs.HTTP_VERSION_TYPE, # http version
+        compatible  : frozenset,              # Names of the headers to be included
+        ) -> Tuple[Tuple[Tuple[str, str], ...], Dict[str, str]]:
+        """ Returns the template for the given browser and http version, restricted to the
+            compatible headers, along with the (output) names of the compatible headers that 
+            do not appear in the template. The latter follow the ones in the template.
+            There are only a few sets of compatible headers per browser, hence the results are stored.
+        """
+
+        key   = (browser, httpVersion, compatible)
+        entry = self.templates.get(key)
+
+        if entry is None:
+            template = tuple((hName, outName) for hName, outName in self.data[browser, httpVersion] if hName in compatible)
+            inTempl  = {hName for hName, _ in template}
+            others   = {hName: self.name(hName, httpVersion) for hName in compatible if hName not in inTempl}
+            entry    = self.templates[key] = (template, others)
+
+        return entry
+
+
+class Selector(metaclass = utils.InstanceCache):
     """ Selects an os, device, and browser based on actual usage
         information obtained from https://gs.statcounter.com/
     """
 
     def __init__(self):
-        """ Imports required data. """
+        """ Imports required data and builds the alias tables used for the selections. """
         
-        self.softwareData = utils.readFile('software_market_share.json')
-        self.countryData  = utils.readFile('countries.json')
+        self.softwareData = registry.load('software_market_share.json')
+        self.countryData  = registry.load('countries.json')
         
         # Extract weights for device and country selection
         self.deviceWeights  = [self.softwareData[d]["usage"]        for d in defs.DEVICES]
         self.countryWeights = [self.countryData[c]["user_fraction"] for c in defs.COUNTRIES]
+
+        # Make tables for the device, country and (per device) browser selection
+        self.deviceTable   = utils.AliasTable(defs.DEVICES,   self.deviceWeights)
+        self.countryTable  = utils.AliasTable(defs.COUNTRIES, self.countryWeights)
+        self.browserTables = {
+            d: utils.AliasTable(
+                population = list(self.softwareData[d]["browser"].keys()),
+                weights    = list(self.softwareData[d]["browser"].values())
+            ) 
+            for d in defs.DEVICES
+        }
         
         return
+
+
+    def _table(self, request: defs.INPUT_TYPE, **kwargs) -> utils.AliasTable:
+        """ Returns the table for the requested selection. """
+
+        if   request == 'browser': return self.browserTables[kwargs.get('device', 'desktop')]
+        elif request == 'device' : return self.deviceTable
+        elif request == 'country': return self.countryTable
+        else: raise ValueError(f'Invalid input type {request} encountered.')
     
 
     def __call__(self, 
         request: defs.INPUT_TYPE, **kwargs
         ) -> Union[defs.DEVICE_TYPE, defs.BROWSER_TYPE, defs.COUNTRY_TYPE]:
-        """ """
-
-        if request == 'browser': 
-            device = kwargs.get('device', 'desktop')
-            return rd.choices(
-                population = list(self.softwareData[device]["browser"].keys()),
-                weights    = list(self.softwareData[device]["browser"].values())
-            )[0]
-        
-        elif request == 'device' : 
-            return rd.choices(defs.DEVICES, self.deviceWeights)[0]
-        
-        elif request == 'country': 
-            return rd.choices(defs.COUNTRIES, self.countryWeights)[0]
-        
-        else: raise ValueError(f'Invalid input type {request} encountered.')
+        """ Makes a (weighted) random selection for the requested input type. """
+
+        return self._table(request, **kwargs)()
+
 
+    def sample(self, 
+        request: defs.INPUT_TYPE, k: int, **kwargs
+        ) -> Union[List[defs.DEVICE_TYPE], List[defs.BROWSER_TYPE], List[defs.COUNTRY_TYPE]]:
+        """ Makes <k> selections in one go. Equivalent to <k> calls of the selector. """
 
-class ClientHintGenerator():
+        return self._table(request, **kwargs).sample(k)
+
+
+class ClientHintGenerator(metaclass = utils.InstanceCache):
     """ Derivation of user agent client hints based on a parsed user agent.
         See: https://github.com/WICG/ua-client-hints for definitions.
     """
 
     def __init__(self):
-        """ Initialisation method. Reads data and instantiates classes. """
+        """ Initialisation method. Reads data. """
 
-        self.cpuBitness = utils.readFile('cpu_bitness.json')
-        self.Parser     = CHParser()
+        self.cpuBitness = registry.load('cpu_bitness.json')
 
         return
 
 
-    def __call__(self, userAgent: str) -> Dict[str, str]:
-        """ Generates client hints from a user agent, using the dictionaries
-            resulting from the parsing operation.
-        """
-
-        # Parse user agent
-        browser, cpu, device, _, os = self.Parser(userAgent)
+    def __call__(self, record: AgentRecord) -> Dict[str, str]:
+        """ Generates client hints from the record of a (pre-parsed) user agent. """
         
         # Extract specific attributes needed
-        bName     = getattr(browser, 'name')
-        bVersion  = getattr(browser, 'version')
-        bMajorVer = getattr(browser, 'majorVersion')
-        cpuArch   = getattr(cpu,     'architecture')
-        devType   = getattr(device,  'type')
-        devModel  = getattr(device,  'model')
-        osName    = getattr(os,      'name')
-        osVersion = getattr(os,      'version')
+        bName     = record.browserName
+        bVersion  = record.browserVersion
+        bMajorVer = record.browserMajorVersion
+        cpuArch   = record.cpuArchitecture
+        devType   = record.deviceType
+        devModel  = record.deviceModel
+        osName    = record.osName
+        osVersion = record.osVersion
         
         # Generate client hints dictionary
         return {
@@ -299,11 +450,23 @@ class ClientHintGenerator():
         return f'"{x}"'
 
 
-class HeaderGenerator(metaclass = utils.Singleton):
+class HeaderGenerator(metaclass = utils.InstanceCache):
     """ Generator of realistic, randomly-chosen HTTP headers.
         Extended from: https://github.com/MichaelTatarski/fake-http-header
+        Instances are cached per constructor arguments (see utils.InstanceCache), i.e. generators 
+        with different user agent sources (e.g. files) coexist, each one with its own user agents, 
+        while the parser and the header data (see the classes above) are shared by all of them. 
+        Use HeaderGenerator.evict(<arguments>) or HeaderGenerator.reset() to discard cached generators.
     """
 
+    # Stages timed when profiling is enabled (see enableProfiling()): the components of the 
+    # generator, which are replaced by timed proxies, the methods of the components that are
+    # called directly (timed as '<component>.<method>'), and the methods of the generator, 
+    # which are shadowed by timed instance attributes.
+    PROFILED_COMPONENTS = ('Selector', 'UserAgent', 'ClientHints', 'Referer', 'Accept', 'Language', 'Encoder')
+    PROFILED_SUBSTAGES  = {'Selector': ('sample',), 'UserAgent': ('record',)}
+    PROFILED_METHODS    = ('_checkInput', '_checkInputs', '_lookup', '_assemble', '_make')
+
     def __init__(self, user_agents: defs.GENERATOR_TYPE = 'program', **kwargs):
         """ Initialisation method. Instantiates necessary ojects. """
 
@@ -317,10 +480,72 @@ class HeaderGenerator(metaclass = utils.Singleton):
         self.Selector    = Selector()
 
         # Header-browser-version compatibility tables
-        self.compTable   = utils.readFile('header_compatibility.json')
+        self.compatible  = Compatibility('header_compatibility.json')
 
         # Browser-based header order
-        self.headerOrder = utils.readFile('header_order.json')
+        self.headerOrder = HeaderOrder('header_order.json', self.compatible.headerNames)
+
+        # Lookups per browser (version), device and http version (see _lookup())
+        self.lookups     = {}
+
+        # Per-stage timings (None if profiling is disabled)
+        self.profiler    = None
+
+        return
+
+
+    def enableProfiling(self, 
+        callback: Union[Callable[[str, float], Any], None] = None # Called with the stage name and elapsed time (s) after each stage
+        ):
+        """ Enables the recording of the number of calls and the cumulative time of each stage of the 
+            generation (see PROFILED_COMPONENTS, PROFILED_SUBSTAGES and PROFILED_METHODS). The stages 
+            are wrapped only while profiling is enabled, hence there is no overhead otherwise. 
+            Restarts the recording if profiling is already enabled. 
+        """
+
+        self.disableProfiling()
+        self.profiler = utils.StageTimer(callback)
+
+        for name in self.PROFILED_COMPONENTS:
+            component = getattr(self, name)
+            setattr(self, name, utils.Timed(component, self.profiler.wrap(name, component)))
+
+        for name, methods in self.PROFILED_SUBSTAGES.items():
+            proxy = getattr(self, name)
+            for method in methods: setattr(proxy, method, self.profiler.wrap(f'{name}.{method}', getattr(proxy.obj, method)))
+
+        for name in self.PROFILED_METHODS:
+            setattr(self, name, self.profiler.wrap(name, getattr(self, name)))
+
+        return
+
+
+    def disableProfiling(self):
+        """ Disables profiling and restores the stages of the generation. """
+
+        if self.profiler is None: return
+
+        for name in self.PROFILED_COMPONENTS: setattr(self, name, getattr(self, name).obj)
+        for name in self.PROFILED_METHODS   : delattr(self, name)
+
+        self.profiler = None
+
+        return
+
+
+    def profileStats(self) -> Dict[str, Dict[str, float]]:
+        """ Returns a snapshot of the number of calls, the cumulative (total_s) and mean (mean_us) time 
+            of each stage since profiling was enabled (empty if disabled). Nested stages are included 
+            in the time of their callers, e.g. Selector in _checkInput, and all the others in _make.
+        """
+
+        return {} if self.profiler is None else self.profiler.snapshot()
+
+
+    def resetProfileStats(self):
+        """ Resets the statistics of all stages (if profiling is enabled). """
+
+        if self.profiler is not None: self.profiler.reset()
 
         return
 
@@ -383,69 +608,94 @@ class HeaderGenerator(metaclass = utils.Singleton):
         return cookieStr
 
 
-    def _removeIncompatible(self, 
-        headers    : dict,              # Dict with all the headers
-        browser    : defs.BROWSER_TYPE, # browser name
-        device     : defs.DEVICE_TYPE,  # device type
-        browserVer : float,             # browser version
-        ) -> dict:
-        """ Extracts compatible headers for a given browser (and version) and device"""
+    def _checkInputs(self, 
+        inputType: defs.INPUT_TYPE,  # Type of input to check or return
+        value    : Union[None, str], # Corresponding value provided by the user
+        k        : int,              # Number of values to return
+        ) -> List[Any]:
+        """ Batch equivalent of _checkInput(). Checks user input (once) if provided, otherwise 
+            it returns <k> values, selected in one go according to usage/market statistics data.
+        """
 
-        # Get compatible header names (keys) and versions (values)
-        compatibleTab = self.compTable[f'{browser}-{device}']
-        
-        headers_ = {} # Dict that contains the compatible headers only
-        for hName, hValue in headers.items():
+        if not value: return self.Selector.sample(inputType, k)
+        else        : return [self._checkInput(inputType, value)] * k
 
-            # Version for which <browser> first supported <hName>
-            minVersion  = compatibleTab[hName]
 
-            # if header <hName> is supported for the given version, add it to the dict
-            if browserVer >= minVersion: headers_[hName] = hValue 
+    def _lookup(self, 
+        browser     : defs.BROWSER_TYPE,      # browser name
+        device      : defs.DEVICE_TYPE,       # device type
+        browserVer  : float,                  # browser version
+        httpVersion : defs.HTTP_VERSION_TYPE, # http version
+        ) -> Tuple[str, Tuple[Tuple[str, str], ...], Dict[str, str]]:
+        """ Returns the value of the Accept header and the header order template (see HeaderOrder)
+            of the compatible headers for a given browser (and version), device and http version. 
+            These depend on the combination of the inputs only, hence they are stored as a bundle, 
+            to be reused by all subsequent calls with the same combination.
+        """
 
-        return headers_
+        key   = (browser, device, browserVer, httpVersion)
+        entry = self.lookups.get(key)
 
-    
-    @staticmethod
-    def _makeHTTPVersionCompatible(
-        headers: dict, httpVersion: defs.HTTP_VERSION_TYPE) -> dict:
-        """ Makes header dict compatible to HTTP version 2.0, i.e.
-            it lowercases their names.
-         """
+        if entry is None:
+            compatible       = self.compatible(browser, device, browserVer) # Compatible header names
+            template, others = self.headerOrder(browser, httpVersion, compatible)
+            entry = self.lookups[key] = (self.Accept(browser, browserVer), template, others)
 
-        if httpVersion == 2:
-            headers = {k.lower(): v for k, v in headers.items()}
-        
-        return headers
+        return entry
 
 
-    def _order(self, 
-        headers     : Dict[str, str],
-        httpVersion : defs.HTTP_VERSION_TYPE, 
-        browser     : defs.BROWSER_TYPE,
+    @staticmethod
+    def _assemble(
+        headers  : Dict[str, str],               # Dict with all the headers
+        template : Tuple[Tuple[str, str], ...],  # Header order template of the compatible headers
+        others   : Dict[str, str],               # Compatible headers not in the template (and their output names)
         ) -> OrderedDict:
-        """ Converts the headers dictionary to an ordered dict based on the browser
-            and http versions.
+        """ Makes the final headers in a single pass: Incompatible headers are removed, 
+            the names are made compatible to the http version (i.e. lowercased for HTTP/2) 
+            and the headers are ordered according to the browser and http version.
          """
 
-        # Extract order for current http version and browser
-        if httpVersion == 1: 
-            orderedHeaderNames = self.headerOrder["http version 1.x"][browser]
-        else: 
-            orderedHeaderNames = self.headerOrder["http version 2.x"][browser]
+        # Headers of the template (if they exist, as they might not for older versions), 
+        # followed by the remaining ones (in an unordered manner)
+        headersOrdered = OrderedDict([(outName, headers[hName]) for hName, outName in template if hName in headers])
+        headersOrdered.update([(others[hName], hValue) for hName, hValue in headers.items() if hName in others])
+        
+        return headersOrdered
+    
+
+    def _make(self,
+        browser     : defs.BROWSER_TYPE,      # browser name
+        device      : defs.DEVICE_TYPE,       # device type
+        country     : defs.COUNTRY_TYPE,      # alpha-2 country code
+        httpVersion : defs.HTTP_VERSION_TYPE, # http version
+        cookie      : Union[None, str],       # Value of the <Cookie> header (if any)
+        ) -> Tuple[OrderedDict[str, str], defs.BROWSER_TYPE, defs.DEVICE_TYPE]:
+        """ Generates the headers for checked inputs. Returns the headers, along with 
+            the browser and device for which the user agent was found.
+        """
 
-        # Make ordered dictionary
-        headersOrdered = OrderedDict()
-        for hName in orderedHeaderNames:
+        # Get user agent client hints and browser version. NOTE: The User Agent can 
+        # overwrite user inputs if an agent is not found for the user-supplied values.
+        browser, device, userAgent = self.UserAgent(browser, device)
+        record      = self.UserAgent.record(userAgent) # Pre-parsed user agent
+        brVersion   = record.version
+        clientHints = self.ClientHints(record)
 
-            if hName in headers: # header might not exist for older versions
-                headersOrdered[hName] = headers.pop(hName)
+        accept, template, others = self._lookup(browser, device, brVersion, httpVersion)
         
-        # Add the remaining headers (in an unordered manner)
-        for hName, hValue in headers.items():
-            headersOrdered[hName] = hValue
+        headers: dict[str, str] =  { # Make (partial) header dictionary
+            "User-Agent"      : userAgent,
+            "Referer"         : self.Referer(country), 
+            "Accept"          : accept,
+            "Accept-Language" : self.Language(country, addQFactors = rd.random() > 0.5),
+            "Accept-Encoding" : self.Encoder(addQFactors = rd.random() > 0.5),
+        }
+
+        if cookie: headers['Cookie'] = cookie  # Add cookies if needed
+        headers.update(clientHints)            # Add client hints
+        headers.update(defs.CONSTANT_HEADERS)  # Add constant-valued headers
         
-        return headersOrdered
+        return self._assemble(headers, template, others), browser, device
     
 
     def __call__(self,
@@ -474,27 +724,8 @@ class HeaderGenerator(metaclass = utils.Singleton):
         if httpVersion not in defs.HTTP_VERSIONS: 
             raise ValueError('Invalid http version.')
         
-        # Get user agent client hints and browser version. NOTE: The User Agent can 
-        # overwrite user inputs if an agent is not found for the user-supplied values.
-        browser_, device_, userAgent = self.UserAgent(browser_, device_)
-        brVersion   = float(self.UserAgent._getAttribute(userAgent, ('browser', 'majorVersion')))
-        clientHints = self.ClientHints(userAgent)
-        
-        headers: dict[str, str] =  { # Make (partial) header dictionary
-            "User-Agent"      : userAgent,
-            "Referer"         : self.Referer(country_), 
-            "Accept"          : self.Accept(browser_, brVersion),
-            "Accept-Language" : self.Language(country_, addQFactors = rd.random() > 0.5),
-            "Accept-Encoding" : self.Encoder(addQFactors = rd.random() > 0.5),
-        }
-
-        if bool(cookies): headers['Cookie'] = self._addCookies(cookies) # Add cookies if needed
-        headers.update(clientHints)           # Add client hints
-        headers.update(defs.CONSTANT_HEADERS) # Add constant-valued headers
-        
-        headers = self._removeIncompatible(headers, browser_, device_, brVersion)
-        headers = self._makeHTTPVersionCompatible(headers, httpVersion)
-        headers = self._order(headers, httpVersion, browser_)
+        cookie = self._addCookies(cookies) if bool(cookies) else None
+        headers, browser_, device_ = self._make(browser_, device_, country_, httpVersion, cookie)
         
         # Print a warning if the user-supplied values were overwritten
         self._warnOnOverwrite(inputType = 'browser', userValue = browser, newValue = browser_)
@@ -502,3 +733,90 @@ class HeaderGenerator(metaclass = utils.Singleton):
         self._warnOnOverwrite(inputType = 'country', userValue = country,  newValue = country_)       
         
         return headers
+
+
+    def generate_many(self,
+        n           : int,                                   # Number of header sets to generate
+        country     : Union[None, defs.COUNTRY_TYPE]  = None, 
+        device      : Union[None, defs.DEVICE_TYPE]   = None, 
+        browser     : Union[None, defs.BROWSER_TYPE]  = None,
+        httpVersion : defs.HTTP_VERSION_TYPE = 1,
+        cookies     : Dict[str, str] = {},
+        ) -> List[OrderedDict[str, str]]:
+        """ Generates a batch of <n> realistic, randomly-chosen HTTP headers. The inputs are the 
+            same as the ones of __call__(), and the headers follow the same distribution as the ones 
+            of <n> separate calls. However, the inputs are checked once, and the browsers, devices and 
+            countries are selected in one go.
+        """
+
+        if n < 0: raise ValueError('Invalid number of headers.')
+
+        return list(self.iter_headers(n, country, device, browser, httpVersion, cookies, chunkSize = max(n, 1)))
+
+
+    def iter_headers(self,
+        limit       : Union[None, int]                = None, # Number of header sets to generate (None for no limit)
+        country     : Union[None, defs.COUNTRY_TYPE]  = None, 
+        device      : Union[None, defs.DEVICE_TYPE]   = None, 
+        browser     : Union[None, defs.BROWSER_TYPE]  = None,
+        httpVersion : defs.HTTP_VERSION_TYPE = 1,
+        cookies     : Dict[str, str] = {},
+        chunkSize   : int = 1024,                             # Number of browsers, devices, countries selected in one go
+        ) -> Iterator[OrderedDict[str, str]]:
+        """ Returns an iterator of realistic, randomly-chosen HTTP headers, that runs forever 
+            (or up to <limit> header sets) in constant memory. The inputs are the same as the ones 
+            of __call__(), and the headers follow the same distribution as the ones of separate calls.
+        """
+
+        if limit is not None and limit < 0: raise ValueError('Invalid number of headers.')
+        if chunkSize < 1                  : raise ValueError('Invalid chunk size.')
+
+        # Sanity check on user supplied values
+        for inputType, value in zip(('browser', 'device', 'country'), (browser, device, country)):
+            if value: self._checkInput(inputType, value)
+
+        if httpVersion not in defs.HTTP_VERSIONS: 
+            raise ValueError('Invalid http version.')
+
+        cookie = self._addCookies(cookies) if bool(cookies) else None
+        
+        return self._iterate(limit, country, device, browser, httpVersion, cookie, chunkSize)
+
+
+    def _iterate(self, 
+        limit       : Union[None, int], 
+        country     : Union[None, defs.COUNTRY_TYPE], 
+        device      : Union[None, defs.DEVICE_TYPE], 
+        browser     : Union[None, defs.BROWSER_TYPE],
+        httpVersion : defs.HTTP_VERSION_TYPE,
+        cookie      : Union[None, str],
+        chunkSize   : int,
+        ) -> Iterator[OrderedDict[str, str]]:
+        """ Generator of headers for checked inputs (see iter_headers()). """
+
+        usedBrowsers, usedDevices, count = set(), set(), 0
+
+        while limit is None or count < limit:
+
+            # Select browsers, devices and countries for the next chunk in one go
+            k         = chunkSize if limit is None else min(chunkSize, limit - count)
+            browsers  = self._checkInputs(inputType = 'browser', value = browser, k = k)
+            devices   = self._checkInputs(inputType = 'device',  value = device,  k = k)
+            countries = self._checkInputs(inputType = 'country', value = country, k = k)
+            
+            for browser_, device_, country_ in zip(browsers, devices, countries):
+
+                headers, browser_, device_ = self._make(browser_, device_, country_, httpVersion, cookie)
+
+                # Print a warning the first time the user-supplied values are overwritten
+                if browser_ not in usedBrowsers:
+                    usedBrowsers.add(browser_)
+                    self._warnOnOverwrite(inputType = 'browser', userValue = browser, newValue = browser_)
+
+                if device_ not in usedDevices:
+                    usedDevices.add(device_)
+                    self._warnOnOverwrite(inputType = 'device', userValue = device, newValue = device_)
+
+                yield headers
+            
+            count += k
@@ -0,0 +1,41 @@
+""" Central registry of the data files (see the data/ folder). Each data file is read once per 
+    process (see utils.readFile()), and all consumers share a read-only view of its contents, 
+    i.e. dicts are exposed as mappingproxies and lists as tuples (recursively).
+"""
+
+from types  import MappingProxyType
+from typing import Any, Dict
+from .utils import readFile
+import time
+
+
+_DATA : Dict[str, Any]   = {} # Read-only contents per data file
+_TIMES: Dict[str, float] = {} # Time (in seconds) needed to read each data file
+
+
+def freeze(obj: Any) -> Any:
+    """ Returns a read-only view of the contents of a data file """
+
+    if   isinstance(obj, dict): return MappingProxyType({key: freeze(value) for key, value in obj.items()})
+    elif isinstance(obj, list): return tuple(freeze(value) for value in obj)
+    else                      : return obj
+
+
+def load(filename: str) -> Any:
+    """ Returns the read-only contents of a data file, reading it on first use """
+
+    try:
+        return _DATA[filename]
+
+    except KeyError:
+        start    = time.perf_counter()
+        contents = _DATA[filename] = freeze(readFile(filename))
+        _TIMES[filename] = time.perf_counter() - start
+
+    return contents
+
+
+def loadTimes() -> Dict[str, float]:
+    """ Returns the time (in seconds) needed to read each of the data files read so far """
+
+    return dict(_TIMES)
@@ -1,2 +1,2 @@
-from .generator import Generator
+from .generator import Generator, AgentRecord
 from .proxies import ParserToClientHintsProxy as CHParser
\ No newline at end of file
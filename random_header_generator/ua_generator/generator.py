@@ -8,14 +8,32 @@
 
 from ..definitions  import BROWSER_TYPE, DEVICE_TYPE, GENERATOR_TYPE
 from ..definitions  import DEVICES, BROWSERS, MAX_USER_AGENT_SIZE as UA_SIZE
-from .proxies       import ParserToGeneratorProxy as Parser
+from .proxies       import ParserToGeneratorProxy as Parser, ParserToClientHintsProxy as CHParser
 from typing         import Dict, List, Tuple
 from collections    import defaultdict
+from dataclasses    import dataclass
 from random         import choice
 from .helpers       import getAgent
 import warnings
 
 
+@dataclass(frozen = True)
+class AgentRecord():
+    """ Pre-parsed user agent. Holds the attributes needed for the generation of the headers, 
+        so that a user agent string does not need to be parsed every time it is used.
+        All string attributes are adapted for the client hints (see proxies.py). 
+    """
+    version             : float # Browser major version (0.0 if unknown)
+    browserName         : str   # Name of the browser
+    browserVersion      : str   # Full browser version
+    browserMajorVersion : str   # Browser major version
+    cpuArchitecture     : str   # CPU architecture
+    deviceType          : str   # Device type (tablet, mobile, etc.)
+    deviceModel         : str   # Device model
+    osName              : str   # Name of the operating system
+    osVersion           : str   # Operating system version
+
+
 class Generator():
     """ User agent generator. """
 
@@ -27,7 +45,9 @@ class Generator():
         """
 
         self.userAgents: Dict[Tuple[str, str], List[str]] = defaultdict(list) # Empty user agent dict
-        self.Parser = Parser()      # Adapter (user agent parser)
+        self.records   : Dict[str, AgentRecord] = {}                          # Pre-parsed user agents
+        self.Parser    = Parser()   # Adapter (user agent parser)
+        self.CHParser  = CHParser() # Adapter for the client hints
         self._import(by, **kwargs)  # Import user agents
 
         return
@@ -95,10 +115,34 @@ class Generator():
         return applicableAgents
 
     
-    def _getAttribute(self, userAgent: str, attribute: tuple) -> str:
-        """ Get an attribute of the user agent string. """
+    def _makeRecord(self, parsed: tuple) -> AgentRecord:
+        """ Makes the record of a user agent from the dataclasses that a Parser's call produces. """
+
+        version = float(parsed[0].majorVersion)    # Read from the dataclasses before they are adapted below
+        browser, cpu, device, _, os = self.CHParser.adapt(parsed)
+
+        return AgentRecord(
+            version             = version,
+            browserName         = browser.name,
+            browserVersion      = browser.version,
+            browserMajorVersion = browser.majorVersion,
+            cpuArchitecture     = cpu.architecture,
+            deviceType          = device.type,
+            deviceModel         = device.model,
+            osName              = os.name,
+            osVersion           = os.version,
+        )
+
+
+    def record(self, userAgent: str) -> AgentRecord:
+        """ Returns the record of a user agent. Imported agents are looked up,
+            whereas any other agent is parsed.
+        """
+
+        record = self.records.get(userAgent)
+        if record is None: record = self._makeRecord(self.Parser.parser(userAgent))
 
-        return self.Parser.get(userAgent, attribute).lower()
+        return record
 
 
     def _import(self, by: GENERATOR_TYPE, **kwargs):
@@ -109,14 +153,16 @@ class Generator():
 
         for userAgent in getAgent(by, **kwargs):
 
-            browser   = self._getAttribute(userAgent, ('browser', 'name'))
-            device    = self._getAttribute(userAgent, ('device', 'type'))
+            parsed    = self.Parser.parser(userAgent) # Parse once for all attributes needed
+            browser   = self.Parser.getParsed(parsed, ('browser', 'name')).lower()
+            device    = self.Parser.getParsed(parsed, ('device', 'type')).lower()
             browserOK = browser in BROWSERS               # Is valid browser
             deviceOK  = device  in DEVICES                # Is valid device
             sizeOK    = len(userAgent.strip()) <= UA_SIZE # Has valid size
 
             if browserOK and deviceOK and sizeOK: # Valid user agent. Add to dict
                 self.userAgents[browser, device].append(userAgent)
+                if userAgent not in self.records: self.records[userAgent] = self._makeRecord(parsed)
                 succesfulImports += 1
             
             else: # Ignore user agent
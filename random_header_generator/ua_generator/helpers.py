@@ -7,9 +7,7 @@ from ..definitions  import BROWSER_TYPE, UNKNOWN_NAME, GENERATOR_TYPE, BROWSERS
 from typing         import Union, cast, Tuple
 from random         import randint, choice
 from .              import constants as c
-from bs4            import BeautifulSoup
-from ..utils        import readFile
-import requests
+from ..registry     import load
 import string
 import os
 
@@ -216,13 +214,16 @@ def getAgent(by: GENERATOR_TYPE, **kwargs):
         ):
         """ Gathers a list of User-Agent strings from http://www.useragentstring.com for the given list of browsers """
 
+        # The scraping dependencies are imported here, as they are not needed by the other generators
+        from bs4 import BeautifulSoup
+        import requests
 
         """ Helper functions """
         def _allAvailable(browsers: Tuple[BROWSER_TYPE]) -> bool: # Names of browsers to be scraped
             """ Checks if all input browsers are available for scraping from the URL """
 
             # Make set of all available browsers
-            lines       = readFile('scraper_browsers.txt')
+            lines       = load('scraper_browsers.txt')
             allBrowsers = set( [b.rstrip('\n') for b in lines] )
             
             return not bool(set(browsers).difference(allBrowsers))
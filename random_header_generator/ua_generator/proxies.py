@@ -3,10 +3,10 @@
 """
 
 from ..definitions  import UNKNOWN_NAME, UNKNOWN_VERSION, PARSER_TYPE, PARSERS, EMPTY
-from typing         import Dict, Tuple
+from typing         import Dict, Mapping, Tuple
 from abc            import ABC, abstractmethod
-from ..ua_parser    import Parser, Dataclass
-from ..utils        import readFile
+from ..ua_parser    import Parser, Dataclass, evolve
+from ..registry     import load
 from dataclasses    import fields
 
 
@@ -19,10 +19,11 @@ class Proxy(ABC):
 
         self.parser = Parser() # Parses an agent string (see ./ua_parser)
 
-        # Dictionary that maps from returned parser value (key), to the value indicated here
-        self.aliases: Dict[PARSER_TYPE, Dict[str, str]] = readFile('parser_adapter.json')
-
-        self.aliases.update({"device": readFile('operating_systems.json')})
+        # Dictionary that maps from returned parser value (key), to the value indicated here.
+        # The (read-only) data are shared by all proxies, hence they are copied to a new dictionary.
+        self.aliases: Dict[PARSER_TYPE, Mapping[str, str]] = {
+            **load('parser_adapter.json'), "device": load('operating_systems.json')
+        }
 
         return
 
@@ -63,6 +64,25 @@ class Proxy(ABC):
         pass
     
 
+    def _getParsed(self, 
+        dclasses  : Tuple[Dataclass, Dataclass, Dataclass, Dataclass, Dataclass], # Dataclasses produced by a Parser's call
+        attribute : Tuple[PARSER_TYPE, str]                                       # Attribute whose value will be returned.
+        ) -> str:
+        """ Get the original attribute of an already parsed user agent string """
+
+        if attribute == ('device', 'type'):
+
+            # Device type will be inferred from OS name.
+            osName = self.getParsed(dclasses, attribute = ('os', 'name'))
+            attr   = self.aliases["device"].get(osName, UNKNOWN_NAME)
+            
+        else: # Get any other attributes from the dataclasses directly
+            parserName, propertyName = attribute
+            attr = getattr(dclasses[PARSERS.index(parserName)], propertyName).lower()
+
+        return attr
+
+
     def get(self, 
         userAgent : str,                     # Agent from which the attribute is needdd
         attribute : Tuple[PARSER_TYPE, str], # Attribute whose value will be returned.
@@ -73,6 +93,37 @@ class Proxy(ABC):
         return self._modify(attribute, attr)
 
 
+    def getParsed(self, 
+        dclasses  : Tuple[Dataclass, Dataclass, Dataclass, Dataclass, Dataclass], # Dataclasses produced by a Parser's call
+        attribute : Tuple[PARSER_TYPE, str]                                       # Attribute whose value will be returned.
+        ) -> str:
+        """ Get an (adapted) attribute of an already parsed user agent string. """
+
+        attr = self._getParsed(dclasses, attribute)
+        return self._modify(attribute, attr)
+
+
+    def getAll(self, userAgent: str) -> Dict[Tuple[PARSER_TYPE, str], str]:
+        """ Get all (adapted) attributes of the user agent string from a single parse. 
+            Returns a dictionary with the attributes (parser name, property name) as keys.
+        """
+
+        return self.getAllParsed(self.parser(userAgent))
+
+
+    def getAllParsed(self, 
+        dclasses: Tuple[Dataclass, Dataclass, Dataclass, Dataclass, Dataclass] # Dataclasses produced by a Parser's call
+        ) -> Dict[Tuple[PARSER_TYPE, str], str]:
+        """ Get all (adapted) attributes of an already parsed user agent string. 
+            Returns a dictionary with the attributes (parser name, property name) as keys.
+        """
+
+        return {
+            (pName, field.name) : self.getParsed(dclasses, (pName, field.name))
+            for pName, dclass in zip(PARSERS, dclasses) for field in fields(dclass)
+        }
+
+
 class ParserToGeneratorProxy(Proxy):
     """ Adapter for a subset of the attribute values returned by the parser.
         Used primarily to modify browser and OS names to be accepted from the extractors (extractors.py).
@@ -86,17 +137,24 @@ class ParserToGeneratorProxy(Proxy):
             their values accordingly before returning them.
         """
 
-        dclasses = self.parser(userAgent) # Dataclasses that a Parser's call produces
+        return self.adapt(self.parser(userAgent))
 
-        for pName, dclass in zip(PARSERS, dclasses):
 
-            for field in fields(dclass):
+    def adapt(self, 
+        dclasses: Tuple[Dataclass, Dataclass, Dataclass, Dataclass, Dataclass] # Dataclasses produced by a Parser's call
+        ) -> Tuple[Dataclass, Dataclass, Dataclass, Dataclass, Dataclass]:
+        """ Returns copies of the dataclasses of an already parsed user agent with modified
+            values, so that the user agent string need not be parsed again.
+        """
 
-                fName = field.name                          # Get field name
-                value = self.get(userAgent, (pName, fName)) # Get modified value
-                setattr(dclass, fName, value)               # Update attribute with new value
+        # Get all modified values before updating any of them, 
+        # as some attributes are inferred from others (e.g. device type)
+        values  = self.getAllParsed(dclasses)
+        changes = {pName: {} for pName in PARSERS}
 
-        return dclasses
+        for (pName, fName), value in values.items(): changes[pName][fName] = value
+
+        return tuple(evolve(dclass, **changes[pName]) for pName, dclass in zip(PARSERS, dclasses))
 
 
     def _modify(self, 
@@ -129,19 +187,28 @@ class ParserToClientHintsProxy(Proxy):
             their values accordingly before returning them.
         """
 
-        dclasses = self.parser(userAgent) # Dataclasses that a Parser's call produces
+        return self.adapt(self.parser(userAgent))
+
+
+    def adapt(self, 
+        dclasses: Tuple[Dataclass, Dataclass, Dataclass, Dataclass, Dataclass] # Dataclasses produced by a Parser's call
+        ) -> Tuple[Dataclass, Dataclass, Dataclass, Dataclass, Dataclass]:
+        """ Returns copies of the dataclasses of an already parsed user agent with modified
+            values, so that the user agent string need not be parsed again.
+        """
 
+        adapted = []
         for dclass in dclasses:
-            for field in fields(dclass):
 
-                # Get name and current value of the dataclass
-                variable = field.name
-                value    = getattr(dclass, variable)
+            # Get names of the fields that need to be modified
+            changes = {
+                field.name: EMPTY for field in fields(dclass) 
+                if getattr(dclass, field.name) in [UNKNOWN_NAME, UNKNOWN_VERSION]
+            }
 
-                # Modify if needed
-                if value in [UNKNOWN_NAME, UNKNOWN_VERSION]: setattr(dclass, variable, EMPTY)
+            adapted.append(evolve(dclass, **changes) if changes else dclass)
 
-        return dclasses
+        return tuple(adapted)
     
 
     def _getOriginal(self, 
@@ -153,6 +220,16 @@ class ParserToClientHintsProxy(Proxy):
         return self.parser.get(userAgent, attribute).lower()
 
 
+    def _getParsed(self, 
+        dclasses  : Tuple[Dataclass, Dataclass, Dataclass, Dataclass, Dataclass], # Dataclasses produced by a Parser's call
+        attribute : Tuple[PARSER_TYPE, str]                                       # Attribute whose value will be returned.
+        ) -> str:
+        """ Get the original attribute of an already parsed user agent string """
+
+        parserName, propertyName = attribute
+        return getattr(dclasses[PARSERS.index(parserName)], propertyName).lower()
+
+
     def _modify(self, 
         attribute : Tuple[PARSER_TYPE, str],  # Attribute whose value will be adapted.
         value     : str                       # Corresponding value returned by the parser
@@ -1,2 +1,12 @@
-from .parser import Parser
-from .datatypes import Dataclass
\ No newline at end of file
+from .parser import Parser
+from .datatypes import Dataclass, ParsedAgent, evolve
+
+
+def __getattr__(name: str):
+    """ Imports ParallelParser on first use, as it loads the multiprocessing modules """
+
+    if name == 'ParallelParser':
+        from .parallel import ParallelParser
+        return ParallelParser
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
\ No newline at end of file
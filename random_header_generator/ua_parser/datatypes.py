@@ -1,8 +1,9 @@
 """ Declaration of classes / datatypes used jointly by all modules """
 
 from ..definitions import UNKNOWN_VERSION, UNKNOWN_NAME
-from typing        import Protocol, ClassVar, Dict
+from typing        import Protocol, ClassVar, Dict, Iterator, Union, Tuple
 from dataclasses   import dataclass
+from copy          import copy
 import re
 
 
@@ -15,7 +16,11 @@ class Dataclass(Protocol):
     __dataclass_fields__: ClassVar[Dict] 
 
 
-@dataclass
+""" The dataclasses are immutable and slotted, hence they can be shared without being copied. 
+    Use evolve() to make modified copies.
+"""
+
+@dataclass(frozen = True, slots = True)
 class Browser:
     version     : str = UNKNOWN_VERSION  # Full browser version
     name        : str = UNKNOWN_NAME     # Name of the browser
@@ -25,43 +30,70 @@ class Browser:
         """ Ensure that the browser details have been properly parsed and 
             extract major version from full version """
         
-        self.majorVersion = re.sub(r'[^\d\.]', r'', self.version).split('.')[0]
+        majorVersion = re.sub(r'[^\d\.]', r'', self.version).split('.')[0]
 
         # If the major version cannot be converted to a float (i.e. the browser 
         # details provided are not valid), set to unknown version
         try: 
-            float(self.majorVersion)
+            float(majorVersion)
+            object.__setattr__(self, 'majorVersion', majorVersion) # The class is frozen
 
         except ValueError:
-            self.version      = UNKNOWN_VERSION
-            self.majorVersion = UNKNOWN_VERSION
+            object.__setattr__(self, 'version',      UNKNOWN_VERSION)
+            object.__setattr__(self, 'majorVersion', UNKNOWN_VERSION)
 
 
-@dataclass
+@dataclass(frozen = True, slots = True)
 class CPU:
     architecture: str = UNKNOWN_NAME # CPU architecture
 
 
-@dataclass
+@dataclass(frozen = True, slots = True)
 class Device:
     vendor: str = UNKNOWN_NAME       # Device brand 
     model : str = UNKNOWN_NAME       # Device model
     type  : str = UNKNOWN_NAME       # Device type (tablet, mobile, etc.)
 
 
-@dataclass
+@dataclass(frozen = True, slots = True)
 class Engine:
     name   : str = UNKNOWN_NAME      # Engine name (Gecko, Webkit, etc.)
     version: str = UNKNOWN_VERSION   # Engine version
 
 
-@dataclass
+@dataclass(frozen = True, slots = True)
 class OS:
     name   : str = UNKNOWN_NAME      # Name of the operating system
     version: str = UNKNOWN_VERSION   # Operating system version
 
 
+@dataclass(frozen = True, slots = True)
+class ParsedAgent:
+    """ Record of all the dataclasses of a parsed user agent. It can also be used as the tuple 
+        browser, cpu, device, engine, os (e.g. for unpacking).
+    """
+    browser: Browser
+    cpu    : CPU
+    device : Device
+    engine : Engine
+    os     : OS
+
+    def __iter__(self) -> Iterator[Dataclass]:
+        return iter((self.browser, self.cpu, self.device, self.engine, self.os))
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Dataclass, Tuple[Dataclass, ...]]:
+        return tuple(self)[index]
 
+    def __len__(self) -> int:
+        return 5
 
 
+def evolve(dclass: Dataclass, **changes) -> Dataclass:
+    """ Returns a copy of an (immutable) dataclass with some fields changed. Unlike dataclasses.replace(),
+        __post_init__ is not run, so that derived fields (e.g. Browser.majorVersion) are not recomputed.
+    """
+
+    new = copy(dclass)
+    for name, value in changes.items(): object.__setattr__(new, name, value)
 
+    return new
@@ -0,0 +1,167 @@
+""" This module implements a multi-process user agent parser, which shards a stream of user agent
+    strings across a pool of worker processes. Each worker holds its own Parser (see parser.py).
+"""
+
+from concurrent.futures import Future
+from collections        import deque
+from itertools          import islice
+from typing             import Iterable, Iterator, List, Dict, Tuple, Union
+from ..definitions      import PARSER_TYPE, ENGINE_TYPE
+from ..utils            import LRUCache
+from .parser            import Parser
+from .                  import datatypes as dtypes
+import os
+
+
+_parser: Union[Parser, None] = None # Parser of a worker process
+
+
+def _initWorker(engine: ENGINE_TYPE):
+    """ Initialises the parser of a worker process, with the given regex engine. """
+
+    global _parser
+
+    _parser = Parser(engine)
+
+    return
+
+
+def _parseChunk(userAgents: List[str]) -> List[dtypes.ParsedAgent]:
+    """ Parses a chunk of (unique) user agent strings in a worker process. """
+
+    return _parser.parse_many(userAgents)
+
+
+class ParallelParser():
+    """ Multi-process user agent parser. The input is split in chunks, which are parsed by a pool of
+        worker processes, and the results are returned in the order of the input. Unique user agents
+        are sent once per chunk, and those seen recently are not sent again (see Parser.iter_parsed()).
+        Use it as a context manager, or call close() to shut down the workers.
+    """
+
+    def __init__(self,
+        workers  : Union[int, None] = None,      # Number of worker processes (defaults to the number of CPUs)
+        chunkSize: int = 5000,                   # Number of user agents per chunk
+        engine   : ENGINE_TYPE = 'sequential',   # Regex engine of the workers' parsers
+        memoSize : int = 100000                  # Number of most recently seen unique user agents whose results are reused (0 to disable)
+        ):
+        """ Initialisation method. Starts the worker processes. """
+
+        # Imported here, as it loads multiprocessing, which is not needed unless parsing in parallel
+        from concurrent.futures import ProcessPoolExecutor
+
+        if chunkSize < 1: raise ValueError('Invalid chunk size.')
+
+        self.workers   = workers or os.cpu_count() or 1
+        self.chunkSize = chunkSize
+        self.memoSize  = memoSize
+        self.pool      = ProcessPoolExecutor(
+            max_workers = self.workers, initializer = _initWorker, initargs = (engine,)
+        )
+
+        return
+
+
+    def parse_many(self,
+        userAgents: Iterable[str], # User agent strings (any iterable, e.g. a generator)
+        columnar  : bool = False   # Whether to return the fields as columns
+        ) -> Union[List[dtypes.ParsedAgent], Dict[Tuple[PARSER_TYPE, str], List[str]]]:
+        """ Parses a batch of user agent strings in parallel. The output is the same as the one
+            of Parser.parse_many().
+        """
+
+        records = [record for chunk in self.iter_parsed(userAgents) for record in chunk]
+
+        return Parser._toColumns(records) if columnar else records
+
+
+    def iter_parsed(self,
+        userAgents: Iterable[str], # User agent strings (any iterable, e.g. a generator)
+        columnar  : bool = False   # Whether to return the fields of each chunk as columns
+        ) -> Iterator[Union[List[dtypes.ParsedAgent], Dict[Tuple[PARSER_TYPE, str], List[str]]]]:
+        """ Returns an iterator of the results of consecutive chunks of the input, in order.
+            The output is the same as the one of Parser.iter_parsed(). A bounded number of chunks
+            is processed ahead, so that the input is consumed lazily and the memory remains bounded.
+        """
+
+        return self._iterate(iter(userAgents), columnar)
+
+
+    def _iterate(self,
+        userAgents: Iterator[str],
+        columnar  : bool
+        ) -> Iterator[Union[List[dtypes.ParsedAgent], Dict[Tuple[PARSER_TYPE, str], List[str]]]]:
+        """ Generator of the results of consecutive chunks (see iter_parsed()). """
+
+        memo    = LRUCache(self.memoSize) if self.memoSize > 0 else None # Records of the most recently seen user agents (if any)
+        pending = deque()                                                # Chunks (and their futures) in order of submission
+
+        while True:
+
+            # Keep all workers busy, with one chunk ahead for each of them
+            while len(pending) < 2 * self.workers:
+                chunk = list(islice(userAgents, self.chunkSize))
+                if not chunk: break
+                pending.append(self._submit(chunk, memo))
+
+            if not pending: break
+
+            records = self._align(*pending.popleft(), memo)
+
+            yield Parser._toColumns(records) if columnar else records
+
+        return
+
+
+    def _submit(self,
+        chunk: List[str],               # User agent strings
+        memo : Union[LRUCache, None]    # Records of the most recently seen user agents (if any)
+        ) -> Tuple[List[str], Dict[str, dtypes.ParsedAgent], List[str], Union[Future, None]]:
+        """ Submits the unique user agents of a chunk that have not been seen recently to the workers.
+            Returns the chunk, the records of the user agents seen recently, the submitted user agents
+            and the future of their results.
+        """
+
+        known, unknown = {}, []
+        for userAgent in dict.fromkeys(chunk):
+            record = memo.get(userAgent) if memo is not None else None
+            if record is None: unknown.append(userAgent)
+            else             : known[userAgent] = record
+
+        future = self.pool.submit(_parseChunk, unknown) if unknown else None
+
+        return chunk, known, unknown, future
+
+
+    @staticmethod
+    def _align(
+        chunk  : List[str],                      # User agent strings
+        known  : Dict[str, dtypes.ParsedAgent],  # Records of the user agents seen recently
+        unknown: List[str],                      # Submitted user agents
+        future : Union[Future, None],            # Future of the results of the submitted user agents
+        memo   : Union[LRUCache, None]           # Records of the most recently seen user agents (if any)
+        ) -> List[dtypes.ParsedAgent]:
+        """ Collects the results of a chunk and aligns them with the input """
+
+        if future is not None:
+            for userAgent, record in zip(unknown, future.result()):
+                known[userAgent] = record
+                if memo is not None: memo.put(userAgent, record)
+
+        return [known[userAgent] for userAgent in chunk]
+
+
+    def close(self):
+        """ Shuts down the worker processes. """
+
+        self.pool.shutdown()
+        return
+
+
+    def __enter__(self) -> 'ParallelParser':
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+        return
@@ -5,13 +5,192 @@
 """
 
 from dataclasses    import fields
-from ..utils        import Singleton
+from ..utils        import InstanceCache, LRUCache
 from .              import regexes as r
 from .              import datatypes as dtypes
-from typing         import Tuple, Union, Callable, List, Type, cast
-from ..definitions  import UNKNOWN_NAME, UNKNOWN_VERSION, PARSER_TYPE, PARSERS
+from typing         import Tuple, Union, Callable, List, Type, Dict, Iterator, Iterable, cast
+from ..definitions  import UNKNOWN_NAME, UNKNOWN_VERSION, PARSER_TYPE, PARSERS, ENGINE_TYPE, ENGINES
+from itertools      import islice
 import re
 
+try:                from re import _parser as sre_parse # Python >= 3.11
+except ImportError: import sre_parse                    # type: ignore
+
+
+class LiteralPrefilter():
+    """ Prefilter for a regex list. It extracts literal tokens from each regex, at least one of 
+        which must appear in a user agent string for the regex to match (e.g. 'ipad', 'pixel', 'edg/').
+        All tokens are searched for with a single scan of the lowercased user agent, which yields
+        the indices of the regexes that may match (including those without any tokens), in the order 
+        of the regex list. The scan is skipped for non-ASCII user agents, as case-insensitive 
+        matching is not equivalent to lowercasing for them.
+    """
+
+    MIN_LENGTH = 2   # Minimum length of the shortest token of a regex (otherwise it is always tried)
+    MAX_TOKENS = 32  # Maximum number of alternative tokens extracted from a part of a regex
+
+    def __init__(self, regexes: List[re.Pattern]):
+        """ Initialisation method. Extracts the tokens of each regex and compiles the scanner. """
+
+        self.size   = len(regexes)
+        self.always = [] # Indices of the regexes without tokens
+        rulesOf     = {} # Indices of the regexes per token
+
+        for i, regex in enumerate(regexes):
+            tokens = self._tokens(regex.pattern, regex.flags)
+            if tokens is None: self.always.append(i)
+            else: 
+                for token in tokens: rulesOf.setdefault(token, set()).add(i)
+
+        # The scanner reports the longest token at each position, hence each token also
+        # yields the regexes of all tokens that are a prefix of it
+        self.rules = {
+            token: frozenset().union(*(rules for other, rules in rulesOf.items() if token.startswith(other)))
+            for token in rulesOf
+        }
+        
+        self.scanner = re.compile('(?=(' + self._trie(self.rules) + '))') if self.rules else None
+
+        return
+
+
+    @classmethod
+    def _trie(cls, tokens) -> str:
+        """ Makes a regex pattern that matches the longest of the tokens at a given position. The tokens are 
+            arranged in a trie (e.g. 'ipad', 'iphone' -> 'ip(?:ad|hone)'), so that the regex engine 
+            only follows the branches that match the string, instead of trying each token in turn.
+        """
+
+        trie = {}
+        for token in tokens:
+            node = trie
+            for char in token: node = node.setdefault(char, {})
+            node[''] = {} # End of token
+
+        def pattern(node: dict) -> str:
+            branches = [re.escape(char) + pattern(child) for char, child in sorted(node.items()) if char]
+            if not branches: return ''
+
+            out = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            return '(?:' + out + ')?' if '' in node else out # Greedy, so that longer tokens are preferred
+
+        return pattern(trie)
+    
+
+    @classmethod
+    def _tokens(cls, pattern: str, flags: int = 0) -> Union[set, None]:
+        """ Returns the tokens of a regex pattern, or None if no (sufficiently long) tokens exist. """
+
+        tokens = cls._required(sre_parse.parse(pattern, flags))
+        if tokens is None or min(map(len, tokens)) < cls.MIN_LENGTH: return None
+        return tokens
+
+
+    @classmethod
+    def _required(cls, items) -> Union[set, None]:
+        """ Returns a set of strings, at least one of which appears in any (lowercased) string 
+            matched by the sequence of parsed regex items, or None if no such set is found. 
+            Among the candidate sets, the one whose shortest string is the longest is returned.
+        """
+
+        options = []   # Candidate sets
+        runs    = {''} # Alternatives for the current run of consecutive fixed items
+
+        for op, av in items:
+            fixed = cls._fixed(op, av)
+
+            if fixed is not None:
+                product = {run + string for run in runs for string in fixed}
+                if len(product) <= cls.MAX_TOKENS:
+                    runs = product
+                    continue
+
+            # The run ends here
+            if '' not in runs: options.append(runs)
+            runs = {''}
+
+            if fixed is None: 
+                required = cls._requiredItem(op, av)
+                if required: options.append(required)
+
+        if '' not in runs: options.append(runs)
+        
+        return max(options, key = lambda set_: min(map(len, set_)), default = None)
+
+
+    @classmethod
+    def _requiredItem(cls, op, av) -> Union[set, None]:
+        """ Returns the set of strings required by a single (non-fixed) parsed regex item (see _required()). """
+
+        if op is sre_parse.SUBPATTERN: 
+            return cls._required(av[-1])
+
+        elif op is sre_parse.BRANCH:
+            branches = [cls._required(items) for items in av[1]]
+            if any(branch is None for branch in branches): return None
+            return set().union(*branches)
+
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            return cls._required(av[2])
+        
+        return None
+    
+
+    @classmethod
+    def _fixed(cls, op, av) -> Union[set, None]:
+        """ Returns the set of (lowercased) strings that a parsed regex item can match, if it is 
+            small and known, or None otherwise. Zero-width items match the empty string.
+        """
+
+        if op is sre_parse.LITERAL:
+            return {chr(av).lower()} if av < 128 else None
+        
+        elif op in (sre_parse.AT, sre_parse.ASSERT, sre_parse.ASSERT_NOT):
+            return {''}
+        
+        elif op is sre_parse.IN:
+            if all(op_ is sre_parse.LITERAL and av_ < 128 for op_, av_ in av):
+                return {chr(av_).lower() for _, av_ in av}
+            
+        elif op is sre_parse.SUBPATTERN:
+            return cls._fixedSeq(av[-1])
+        
+        elif op is sre_parse.BRANCH:
+            branches = [cls._fixedSeq(items) for items in av[1]]
+            if all(branch is not None for branch in branches): return set().union(*branches)
+
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[:2] in ((0, 1), (1, 1)):
+            fixed = cls._fixedSeq(av[2])
+            if fixed is not None: return fixed | {''} if av[0] == 0 else fixed
+        
+        return None
+    
+
+    @classmethod
+    def _fixedSeq(cls, items) -> Union[set, None]:
+        """ Returns the set of strings that a sequence of parsed regex items can match (see _fixed()). """
+
+        strings = {''}
+        for op, av in items:
+            fixed = cls._fixed(op, av)
+            if fixed is None: return None
+            
+            strings = {string + other for string in strings for other in fixed}
+            if len(strings) > cls.MAX_TOKENS: return None
+        
+        return strings
+
+
+    def __call__(self, userAgent: str) -> Union[List[int], range]:
+        """ Returns the indices of the regexes that may match the user agent string, in increasing order. """
+
+        if self.scanner is None or not userAgent.isascii(): return range(self.size)
+
+        found = set(self.always)
+        for match in self.scanner.finditer(userAgent.lower()): found |= self.rules[match.group(1)]
+
+        return sorted(found)
+
 
 class GenericParser():
     """ Generic parser class. Parses a user agent string to extract information about 
@@ -24,13 +203,17 @@ class GenericParser():
     """
 
     def __init__(self, 
-        regexes: List[r.REGEXDICT],   # List of regexes to use for property matching 
-        cls    : Type[dtypes.Dataclass] # Dataclass that will be given as output
+        regexes  : List[r.REGEXDICT],      # List of regexes to use for property matching 
+        cls      : Type[dtypes.Dataclass], # Dataclass that will be given as output
+        prefilter: bool = True             # Whether to skip the regexes that cannot match (see LiteralPrefilter)
         ):
         """ Initialisation method """
 
         self.regexes   = regexes 
         self.className = cls     
+        self.prefilter = LiteralPrefilter([dict_['regex'] for dict_ in regexes]) if prefilter else None
+        self.defaults  = {f.name: f.default for f in fields(cls) if f.init} # Default value of each field (computed once)
+        self.derived   = hasattr(cls, '__post_init__')                      # Whether fields depend on each other
 
         return 
 
@@ -44,7 +227,11 @@ class GenericParser():
         
         matches, dict_ = None, cast(r.REGEXDICT, {})
 
-        for dict_ in self.regexes:
+        # Only the regexes that pass the prefilter are tried, in the order of the list
+        indices = self.prefilter(userAgent) if self.prefilter else range(len(self.regexes))
+
+        for i in indices:
+            dict_   = self.regexes[i]
             matches = dict_['regex'].search(userAgent)
             if matches: break
         
@@ -52,16 +239,20 @@ class GenericParser():
 
 
     @staticmethod
-    def _makeDict(matches: Union[re.Match[str], None], dict_ : r.REGEXDICT) -> dict:
+    def _group(matches: re.Match[str], i: int) -> Union[str, None]:
+        """ Returns the substring matched by the i-th group (counting from zero), or None if the group does not exist """
+
+        try:               return matches.group(i + 1)
+        except IndexError: return None
+
+
+    def _makeDict(self, matches: Union[re.Match[str], None], dict_ : r.REGEXDICT) -> dict:
         """ Makes dictionary with all properties that match """
 
         d = {} # Output dictionary
-        if matches:
+        if matches is not None:
             for i, (key, value) in enumerate(dict_['props'].items()):
-                try:               match = matches.group(i + 1)
-                except IndexError: match = None
-
-                d[key] = GenericParser._map(match, key, value)
+                d[key] = self._map(self._group(matches, i), key, value)
 
         return d
 
@@ -103,12 +294,9 @@ class GenericParser():
     def _dataClassFromDict(self, argDict: dict, filter = False):
         """ Populates the appropriate dataclass from a dictionary """
 
-        # Get fields that exist in the class
-        fieldSet = {f.name for f in fields(self.className) if f.init}
-
         # Remove additional args from the argDict that do not appear in the dataclass if needed
         if filter:
-            filteredArgDict = {k : v for k, v in argDict.items() if k in fieldSet}
+            filteredArgDict = {k : v for k, v in argDict.items() if k in self.defaults}
         else:
             filteredArgDict = argDict
             
@@ -116,6 +304,34 @@ class GenericParser():
         return self.className(**filteredArgDict)
 
     
+    def _fromMatch(self, matches: Union[re.Match[str], None], dict_ : r.REGEXDICT) -> dtypes.Dataclass:
+        """ Generates the data class from the result of _getMatch() """
+
+        d = self._makeDict(matches, dict_)
+        c = self._dataClassFromDict(d)
+        
+        return c
+
+
+    def _fieldFromMatch(self, matches: Union[re.Match[str], None], dict_ : r.REGEXDICT, key: str) -> str:
+        """ Returns a single field of the data class from the result of _getMatch(), without generating
+            the data class, unless its fields depend on each other. Raises AttributeError if not found.
+        """
+
+        if self.derived: 
+            return getattr(self._fromMatch(matches, dict_), key)
+        
+        if key not in self.defaults: 
+            raise AttributeError(f"'{self.className.__name__}' object has no attribute '{key}'")
+
+        props = dict_['props'] if matches is not None else {}
+
+        for i, (propKey, value) in enumerate(props.items()):
+            if propKey == key: return self._map(self._group(matches, i), key, value)
+
+        return self.defaults[key]
+
+    
     def __call__(self, userAgent: str) -> dtypes.Dataclass:
         """ Searches the regex list (see regexes.py) for a match with the user
             agent string, and extracts the information needed from a user agent 
@@ -123,50 +339,419 @@ class GenericParser():
             the appropriate data class
         """
 
-        matches, dict_ = self._getMatch(userAgent)
-        d = self._makeDict(matches, dict_)
-        c = self._dataClassFromDict(d)
+        return self._fromMatch(*self._getMatch(userAgent))
+
+
+class CombinedParser(GenericParser):
+    """ Generic parser that compiles its regex list into a single master regex, so that the 
+        matching rule is found with one call, instead of searching the regexes one by one.
+        Each rule <i> is placed in a lookahead that scans the whole string, in a group named 'r<i>',
+        and its capturing groups are renamed to 'r<i>_<j>'. As the alternatives are tried in order,
+        the first rule of the list that matches anywhere in the string wins, with the same groups 
+        as its own search would give.
+    """
+
+    FLAGS = {re.I: 'i', re.M: 'm', re.S: 's'} # Flags that can be scoped to each rule
+
+    def __init__(self, 
+        regexes  : List[r.REGEXDICT],      # List of regexes to use for property matching 
+        cls      : Type[dtypes.Dataclass], # Dataclass that will be given as output
+        prefilter: bool = False            # Not used, as all rules are matched at once
+        ):
+        """ Initialisation method. Compiles the master regex. """
+
+        super().__init__(regexes, cls, prefilter = False)
+
+        branches = []
+        for i, dict_ in enumerate(regexes):
+            pattern, flags = dict_['regex'].pattern, dict_['regex'].flags & ~re.U
+            scoped = ''.join(letter for flag, letter in self.FLAGS.items() if flags & flag)
+
+            if flags & ~sum(self.FLAGS): raise ValueError(f'Flags of regex {pattern} cannot be scoped.')
+            branches.append(rf'(?=[\s\S]*?(?P<r{i}>(?{scoped}:{self._nameGroups(pattern, f"r{i}")})))')
         
-        return c
+        self.master = re.compile('^(?:' + '|'.join(branches) + ')')
+
+        # Rule index of each wrapper group, and master group indices of the groups of each rule
+        index       = self.master.groupindex
+        self.rules  = {index[f'r{i}']: i for i in range(len(regexes))}
+        self.groups = [
+            tuple(index[f'r{i}_{j}'] for j in range(1, dict_['regex'].groups + 1)) 
+            for i, dict_ in enumerate(regexes)
+        ]
+
+        return
+    
+
+    @staticmethod
+    def _nameGroups(pattern: str, prefix: str) -> str:
+        """ Renames the capturing groups of a pattern to <prefix>_<number>, and replaces the 
+            numbered backreferences accordingly, so that the pattern can be embedded in another one.
+        """
+
+        out, i, num, inClass = [], 0, 0, False
+
+        while i < len(pattern):
+            char = pattern[i]
+
+            if char == '\\':
+                ref = re.match(r'[1-9]\d?', pattern[i + 1:])
+                if ref and not inClass and not re.match(r'[0-7]{3}', pattern[i + 1:]):
+                    out.append(f'(?P={prefix}_{ref.group()})') # Backreference (3 octal digits are a character)
+                    i += 1 + len(ref.group())
+                else:
+                    out.append(pattern[i:i + 2])               # Escaped character
+                    i += 2
+                continue
+
+            if inClass:
+                inClass = char != ']'
+
+            elif char == '[':
+                inClass = True
+                start   = i + 1 + (pattern[i + 1:i + 2] == '^')  # A ']' right after '[' or '[^' is a literal
+                if pattern[start:start + 1] == ']': 
+                    out.append(pattern[i:start + 1])
+                    i = start + 1
+                    continue
+
+            elif char == '(' and pattern[i + 1:i + 3] == '?P':
+                raise ValueError(f'Named groups of regex {pattern} are not supported.')
+            
+            elif char == '(' and pattern[i + 1:i + 2] != '?':
+                num += 1
+                out.append(f'(?P<{prefix}_{num}>')
+                i += 1
+                continue
+
+            out.append(char)
+            i += 1
+        
+        return ''.join(out)
+
+
+    def _getMatch(self, userAgent: str) -> \
+        Tuple[Union[Tuple[Union[str, None], ...], None], r.REGEXDICT]:
+        """ Matches the user agent string with the master regex. It returns the values of the 
+            groups of the winning rule, and the dictionary that will map its keys to them.
+        """
+
+        matches = self.master.match(userAgent)
+        if matches is None: return None, cast(r.REGEXDICT, {})
+
+        i = self.rules[matches.lastindex] # The wrapper group of the rule is the last one to close
+        
+        return tuple(map(matches.group, self.groups[i])), self.regexes[i]
+
+
+    @staticmethod
+    def _group(groups: Tuple[Union[str, None], ...], i: int) -> Union[str, None]:
+        """ Returns the substring matched by the i-th group of the rule, or None if the rule has fewer groups """
 
+        return groups[i] if i < len(groups) else None
 
-def parserFactory(name: PARSER_TYPE) -> GenericParser:
-    """ Makes a GenericParser object according to the specified type (name). """
 
-    if   name == 'browser': return GenericParser(r.BROWSER, dtypes.Browser)
-    elif name == 'cpu'    : return GenericParser(r.CPU,     dtypes.CPU)
-    elif name == 'device' : return GenericParser(r.DEVICE,  dtypes.Device)
-    elif name == 'engine' : return GenericParser(r.ENGINE,  dtypes.Engine)
-    elif name == 'os'     : return GenericParser(r.OS,      dtypes.OS)
+def parserFactory(name: PARSER_TYPE, engine: ENGINE_TYPE = 'sequential') -> GenericParser:
+    """ Makes a GenericParser object according to the specified type (name) and regex engine. """
+
+    if   engine == 'sequential': Generic = GenericParser
+    elif engine == 'combined'  : Generic = CombinedParser
+    else: raise ValueError(f" Engine {engine} is not implemented.")
+
+    if   name == 'browser': return Generic(r.BROWSER, dtypes.Browser)
+    elif name == 'cpu'    : return Generic(r.CPU,     dtypes.CPU)
+    elif name == 'device' : return Generic(r.DEVICE,  dtypes.Device)
+    elif name == 'engine' : return Generic(r.ENGINE,  dtypes.Engine, prefilter = False) # Too short to benefit
+    elif name == 'os'     : return Generic(r.OS,      dtypes.OS)
     else: raise ValueError(f" Parser {name} is not implemented.")
 
 
-class Parser(metaclass = Singleton):
+class LazyParsers(dict):
+    """ GenericParser objects per name (see PARSERS). Each one is made, i.e. its regex list 
+        is compiled (see regexes.py), the first time it is looked up.
+    """
+
+    def __init__(self, engine: ENGINE_TYPE):
+        """ Initialisation method """
+
+        super().__init__()
+        self.engine = engine
+
+        return
+
+
+    def __missing__(self, name: PARSER_TYPE) -> GenericParser:
+        """ Makes the parser of the given name. """
+
+        if name not in PARSERS: raise KeyError(name)
+
+        parser = self[name] = parserFactory(name, self.engine)
+
+        return parser
+
+
+class LazyAgent():
+    """ Lazy parse result of a user agent string. It behaves as the tuple of the dataclasses 
+        browser, cpu, device, engine, os (in order of appearance), but each dataclass is only made
+        when first accessed, and each field can be read without making its dataclass (see field()).
+        The regex matches, dataclasses and fields are memoised. As the dataclasses are immutable, 
+        the object can be shared freely. Use record() to get a compact record of all dataclasses.
+    """
+
+    __slots__ = ('userAgent', 'parsers', 'matches', 'sections', 'fields')
+
+    def __init__(self, 
+        userAgent: str,                      # User agent string
+        parsers  : Dict[str, GenericParser], # Parsers per name (see Parser)
+        ):
+        """ Initialisation method """
+
+        self.userAgent = userAgent
+        self.parsers   = parsers
+        self.matches   = {} # Regex search results per parser name
+        self.sections  = {} # Dataclasses per parser name
+        self.fields    = {} # Fields per (parser name, field name)
+
+        return
+
+
+    def _match(self, name: PARSER_TYPE) -> tuple:
+        """ Returns the (memoised) result of the regex search of a parser """
+
+        match = self.matches.get(name)
+        if match is None: match = self.matches[name] = self.parsers[name]._getMatch(self.userAgent)
+
+        return match
+
+
+    def section(self, name: PARSER_TYPE) -> dtypes.Dataclass:
+        """ Returns the (memoised) dataclass of a parser """
+
+        dclass = self.sections.get(name)
+        if dclass is None: dclass = self.sections[name] = self.parsers[name]._fromMatch(*self._match(name))
+
+        return dclass
+
+
+    def field(self, name: PARSER_TYPE, key: str) -> str:
+        """ Returns the (memoised) value of a field of a parser's dataclass. 
+            Raises AttributeError if not found.
+        """
+
+        if name in self.sections: return getattr(self.sections[name], key)
+
+        value = self.fields.get((name, key))
+        if value is None: value = self.fields[name, key] = self.parsers[name]._fieldFromMatch(*self._match(name), key)
+
+        return value
+
+
+    def record(self) -> dtypes.ParsedAgent:
+        """ Returns the record of all dataclasses, which (unlike this object) holds no regex matches """
+
+        return dtypes.ParsedAgent(*self)
+
+
+    def __getitem__(self, index: Union[int, slice]):
+        """ Returns the dataclass(es) at the given position(s) """
+
+        if isinstance(index, slice): return tuple(self.section(name) for name in PARSERS[index])
+        return self.section(PARSERS[index])
+
+
+    def __iter__(self) -> Iterator[dtypes.Dataclass]:
+        return (self.section(name) for name in PARSERS)
+    
+
+    def __len__(self) -> int:
+        return len(PARSERS)
+    
+
+    def __eq__(self, other) -> bool:
+        return tuple(self) == tuple(other) if isinstance(other, (LazyAgent, tuple)) else NotImplemented
+    
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}{tuple(self)}'
+
+
+class Parser(metaclass = InstanceCache):
     """ User agent string parser. It extracts the following information:
         Browser : name, version, major version
         CPU     : architecture
         Device  : vendor, model, type
         Engine  : name, version
         OS      : name, version
+        The regexes are either searched one by one ('sequential' engine), or all at once with a master
+        regex per parser ('combined' engine), which give the same results. 
+        Instances are cached per engine (see utils.InstanceCache), i.e. Parser() returns the same 
+        object every time, and Parser('combined') another one. The engine of an instance is fixed.
+        The parsers are made on first use (see LazyParsers), e.g. the device regexes are not 
+        compiled unless device properties are needed. Use warmUp() to make them up front.
     """
 
-    def __init__(self):
-        """ Initialisation method. Instantiates required parsers. 
+    def __init__(self, engine: ENGINE_TYPE = 'sequential'):
+        """ Initialisation method. Sets the regex engine of the parsers, which are made on first use.
             The format of the input lists can be found on regexes.py
         """
 
+        if engine not in ENGINES: raise ValueError(f" Engine {engine} is not implemented.")
+
         # Dictionary of parser names and corresponding objects
-        self.parsers = {key: parserFactory(key) for key in PARSERS}
+        self.parsers = LazyParsers(engine)
+        self.engine  = engine
+        self.cache: Union[LRUCache, None] = None # Parse results cache (disabled by default)
+
+        return
+
+
+    def warmUp(self):
+        """ Makes all parsers, i.e. compiles all regexes, instead of doing so on first use. """
+
+        r.warmUp()
+        for name in PARSERS: self.parsers[name]
+
+        return
+
+
+    def enableCache(self, maxsize: int = 4096):
+        """ Enables (or resizes) the cache of parse results, keyed by the user agent string. 
+            The maxsize least recently used user agents are retained. If the cache is already 
+            enabled, its entries and statistics are kept (except for the evicted entries).
+        """
+
+        if self.cache is None: self.cache = LRUCache(maxsize)
+        else                 : self.cache.resize(maxsize)
+        return
+
+
+    def disableCache(self):
+        """ Disables the cache of parse results. """
+
+        self.cache = None
+        return
+
 
+    def clearCache(self):
+        """ Empties the cache of parse results (if enabled) and resets its statistics. """
+
+        if self.cache is not None: self.cache.clear()
         return
 
 
-    def __call__(self, userAgent: str) -> \
-        Tuple[dtypes.Dataclass, dtypes.Dataclass, dtypes.Dataclass, dtypes.Dataclass, dtypes.Dataclass]:
+    def cacheInfo(self) -> Union[Dict[str, int], None]:
+        """ Returns the hits, misses, evictions, size and maxsize of the cache 
+            of parse results, or None if the cache is disabled.
+        """
+
+        return self.cache.info() if self.cache is not None else None
+
+
+    def _parse(self, userAgent: str) -> LazyAgent:
+        """ Makes the lazy parse result of a user agent string, looking it up in the cache first (if enabled). """
+
+        if self.cache is None: return LazyAgent(userAgent, self.parsers)
+
+        agent = self.cache.get(userAgent)
+
+        if agent is None:
+            agent = LazyAgent(userAgent, self.parsers)
+            self.cache.put(userAgent, agent)
+
+        return agent
+
+
+    def __call__(self, userAgent: str) -> LazyAgent:
         """ Parses a user agent string, returning the following classes (in order of appearance):
             browser, cpu, device, engine, os
+            The parsing is lazy: each class is made when first accessed (see LazyAgent).
+        """
+
+        return self._parse(userAgent)
+
+
+    def parse_many(self, 
+        userAgents: Iterable[str], # User agent strings (any iterable, e.g. a generator)
+        columnar  : bool = False   # Whether to return the fields as columns
+        ) -> Union[List[dtypes.ParsedAgent], Dict[Tuple[PARSER_TYPE, str], List[str]]]:
+        """ Parses a batch of user agent strings. Each unique user agent is parsed once, and the results 
+            are aligned with the input. It returns either a list of records (see ParsedAgent), or
+            a dictionary with the attributes (parser name, property name) as keys, and the lists 
+            of their values (columns) as values.
+            Use iter_parsed() to parse large inputs in bounded memory.
+        """
+
+        return self._parseChunk(list(userAgents), None, columnar)
+
+
+    def iter_parsed(self, 
+        userAgents: Iterable[str],  # User agent strings (any iterable, e.g. a generator)
+        chunkSize : int  = 10000,   # Number of user agents per chunk
+        columnar  : bool = False,   # Whether to return the fields of each chunk as columns
+        memoSize  : int  = 100000   # Number of most recently seen unique user agents whose results are reused (0 to disable)
+        ) -> Iterator[Union[List[dtypes.ParsedAgent], Dict[Tuple[PARSER_TYPE, str], List[str]]]]:
+        """ Returns an iterator of the results of parse_many() for consecutive chunks of the input, 
+            so that the input is consumed lazily and the memory remains bounded. Unique user 
+            agents are parsed once per chunk, and are reused across chunks while they remain 
+            in the memo of the most recently seen ones.
+        """
+
+        if chunkSize < 1: raise ValueError('Invalid chunk size.')
+
+        memo = LRUCache(memoSize) if memoSize > 0 else None
+        
+        return self._iterate(iter(userAgents), chunkSize, columnar, memo)
+
+
+    def _iterate(self, 
+        userAgents: Iterator[str], 
+        chunkSize : int, 
+        columnar  : bool, 
+        memo      : Union[LRUCache, None]
+        ) -> Iterator[Union[List[dtypes.ParsedAgent], Dict[Tuple[PARSER_TYPE, str], List[str]]]]:
+        """ Generator of the results of consecutive chunks for checked inputs (see iter_parsed()). """
+
+        while chunk := list(islice(userAgents, chunkSize)): 
+            yield self._parseChunk(chunk, memo, columnar)
+
+
+    def _parseChunk(self, 
+        chunk   : List[str],                # User agent strings
+        memo    : Union[LRUCache, None],    # Records of previously parsed user agents (if any)
+        columnar: bool                      # Whether to return the fields as columns
+        ) -> Union[List[dtypes.ParsedAgent], Dict[Tuple[PARSER_TYPE, str], List[str]]]:
+        """ Parses a chunk of user agent strings (see parse_many()). """
+
+        records = dict.fromkeys(chunk) # Unique user agents in order of appearance
+
+        for userAgent in records:
+            record = memo.get(userAgent) if memo is not None else None
+
+            if record is None:
+                record = self._parse(userAgent).record()
+                if memo is not None: memo.put(userAgent, record)
+
+            records[userAgent] = record
+
+        aligned = [records[userAgent] for userAgent in chunk]
+        
+        return self._toColumns(aligned) if columnar else aligned
+    
+
+    @staticmethod
+    def _toColumns(records: List[dtypes.ParsedAgent]) -> Dict[Tuple[PARSER_TYPE, str], List[str]]:
+        """ Converts a list of records to columns, one for each attribute (parser name, property name).
+            The attributes are the (init) fields of the dataclasses, hence no parser is needed.
         """
-        return tuple(self.parsers[key](userAgent) for key in PARSERS)
+
+        columns = {}
+        for i, section in enumerate(fields(dtypes.ParsedAgent)):
+            dclasses = [record[i] for record in records]
+
+            for field in fields(section.type):
+                if field.init: columns[section.name, field.name] = [getattr(dclass, field.name) for dclass in dclasses]
+
+        return columns
 
     
     def get(self,
@@ -179,11 +764,10 @@ class Parser(metaclass = Singleton):
         """
 
         parserName, propertyName = attribute     # Parser's name and key that the parser should look for        
-        parser = self.parsers.get(parserName)    # Get the parser that will provide the key's value
 
-        if parser:
-            dClass = parser(userAgent)           # Get object from the corresponding generic parser
-            return getattr(dClass, propertyName) # Extract the corresponding key (=property). Raises AttributeError if not found
+        if parserName in PARSERS:
+            # Only the corresponding parser is run. Raises AttributeError if the key is not found
+            return self._parse(userAgent).field(parserName, propertyName)
 
         else: 
             raise KeyError(f'Parser {parserName} does not exist')
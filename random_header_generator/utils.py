@@ -1,17 +1,60 @@
 """ Implementation of some helper classes/function used by various submodules. """
 
-from abc     import ABCMeta
-from typing  import Any
+from abc         import ABCMeta
+from typing      import Any, Callable, Dict, Hashable, List, Sequence, Union
+from collections import OrderedDict
+from functools   import lru_cache
 import random as rd
+import hashlib
+import inspect
+import pickle
 import json
+import time
 import os
 import os
 
-PATH  = os.path.dirname(__file__) # Absolute path of this file
+PATH           = os.path.dirname(__file__)                   # Absolute path of this file
+BUNDLE         = os.path.join(PATH, 'data', 'bundle.pickle') # Compiled data bundle (see bundle.py)
+BUNDLE_VERSION = 1                                           # Format version of the bundle
 
 
-def readFile(filename: str) -> Any:
-    """ Generic txt/json reader """
+def dataFiles() -> List[str]:
+    """ Returns the (sorted) names of the txt/json data files """
+
+    return sorted(name for name in os.listdir(os.path.join(PATH, 'data')) if name.endswith(('.json', '.txt')))
+
+
+def dataChecksum() -> str:
+    """ Returns the checksum of the names and contents of the data files """
+
+    digest = hashlib.sha256()
+    for name in dataFiles():
+        with open(os.path.join(PATH, 'data', name), mode = 'rb') as f: contents = f.read()
+        digest.update(f'{name}:{len(contents)}:'.encode('utf-8'))
+        digest.update(contents)
+
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize = None)
+def loadBundle() -> Union[Dict[str, bytes], None]:
+    """ Loads the compiled data bundle once per process. Returns the (pickled) contents per 
+        data file, or None if the bundle does not exist, cannot be read, or is out of date.
+    """
+
+    try:
+        with open(BUNDLE, mode = 'rb') as f: bundle = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+
+    if not isinstance(bundle, dict) or bundle.get('version') != BUNDLE_VERSION or bundle.get('checksum') != dataChecksum():
+        return None
+
+    return bundle['files']
+
+
+def parseFile(filename: str) -> Any:
+    """ Parses a txt (list of lines) or json data file """
 
     isjson   = lambda x: x.endswith('.json')
     istxt    = lambda x: x.endswith('.txt')
@@ -30,6 +73,17 @@ def readFile(filename: str) -> Any:
     return contents
 
 
+def readFile(filename: str) -> Any:
+    """ Generic txt/json reader. The contents are read from the compiled 
+        data bundle (see bundle.py), if it is up to date.
+    """
+
+    files = loadBundle()
+    if files is not None and filename in files: return pickle.loads(files[filename])
+
+    return parseFile(filename)
+
+
 def addQFactors(l:list) -> list:
         """ Appends randomly generated relative quality factors (q-factors) 
             to the elements (strings) of the input list l.
@@ -51,13 +105,283 @@ def addQFactors(l:list) -> list:
         return l
 
 
-class Singleton(ABCMeta):
-    """ Singleton metaclass """
-    _instances = {}
+class InstanceCache(ABCMeta):
+    """ Metaclass that caches the instances of a class, keyed by the (bound) arguments of the 
+        constructor, i.e. instantiating the class again with equivalent arguments (including the 
+        defaults) returns the cached instance, while different arguments make a new one.
+        Instances made with unhashable arguments are not cached.
+    """
+    _instances: Dict[type, Dict[Hashable, Any]] = {} # Cached instances per class and key
 
     def __call__(cls, *args, **kwargs):
 
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+        try: 
+            key = cls._cacheKey(*args, **kwargs)
+        except TypeError: # Unhashable arguments
+            return super(InstanceCache, cls).__call__(*args, **kwargs)
+
+        instances = InstanceCache._instances.setdefault(cls, {})
+        if key not in instances: 
+            instances[key] = super(InstanceCache, cls).__call__(*args, **kwargs)
+
+        return instances[key]
+
+
+    def _cacheKey(cls, *args, **kwargs) -> Hashable:
+        """ Returns the cache key of the constructor arguments. Raises TypeError if they are unhashable. """
+
+        bound = inspect.signature(cls.__init__).bind(None, *args, **kwargs)
+        bound.apply_defaults()
+        key   = tuple((name, _hashable(value)) for name, value in list(bound.arguments.items())[1:])
+        hash(key)
+
+        return key
+
+
+    def reset(cls):
+        """ Removes all cached instances of the class. """
+
+        InstanceCache._instances.pop(cls, None)
+        return
+
+
+    def evict(cls, *args, **kwargs) -> bool:
+        """ Removes the cached instance made with the given constructor arguments. 
+            Returns True if it was cached.
+        """
+
+        return InstanceCache._instances.get(cls, {}).pop(cls._cacheKey(*args, **kwargs), None) is not None
+
+
+def _hashable(value: Any) -> Hashable:
+    """ Converts (nested) dicts, lists and sets to hashable equivalents (see InstanceCache) """
+
+    if   isinstance(value, dict)            : return frozenset((key, _hashable(v)) for key, v in value.items())
+    elif isinstance(value, (list, tuple))   : return tuple(_hashable(v) for v in value)
+    elif isinstance(value, (set, frozenset)): return frozenset(_hashable(v) for v in value)
+    else                                    : return value
+
+
+class LRUCache():
+    """ Size-bounded cache that evicts the least recently used entries.
+        Keeps count of the hits, misses and evictions.
+    """
+
+    def __init__(self, maxsize: int):
+        """ Initialisation method """
+
+        if maxsize < 1: raise ValueError('Cache size must be a positive integer.')
+
+        self.maxsize = maxsize
+        self.data    = OrderedDict()
+        self.clear()
+
+        return
+
+
+    def __len__(self) -> int: return len(self.data)
+
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """ Returns the value of a key (marking it as recently used) or the default value if it is missing. """
+
+        try: 
+            value = self.data[key]
+
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.data.move_to_end(key)
+        self.hits += 1
+
+        return value
+
+
+    def put(self, key: Hashable, value: Any):
+        """ Adds (or updates) a key, evicting the least recently used one if the cache is full. """
+
+        self.data[key] = value
+        self.data.move_to_end(key)
+
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last = False)
+            self.evictions += 1
+
+        return
+
+
+    def resize(self, maxsize: int):
+        """ Changes the size of the cache, evicting the least recently used entries if it shrinks. """
+
+        if maxsize < 1: raise ValueError('Cache size must be a positive integer.')
+
+        self.maxsize = maxsize
+        while len(self.data) > self.maxsize:
+            self.data.popitem(last = False)
+            self.evictions += 1
+
+        return
+
+
+    def clear(self):
+        """ Empties the cache and resets its statistics. """
+
+        self.data.clear()
+        self.hits, self.misses, self.evictions = 0, 0, 0
+
+        return
+
+
+    def info(self) -> Dict[str, int]:
+        """ Returns the statistics of the cache. """
+
+        return {
+            'hits'      : self.hits,
+            'misses'    : self.misses,
+            'evictions' : self.evictions,
+            'size'      : len(self.data),
+            'maxsize'   : self.maxsize,
+        }
+
+
+class StageTimer():
+    """ Records the number of calls and the cumulative time of the stages of a pipeline.
+        Each stage is a callable wrapped with wrap(). An optional callback is invoked with
+        the stage name and the elapsed time (in seconds) after every call of a stage.
+    """
+
+    def __init__(self, callback: Union[Callable[[str, float], Any], None] = None):
+        """ Initialisation method """
+
+        self.callback = callback
+        self.stats    = {} # Stage name -> [number of calls, cumulative time in seconds]
+
+        return
+
+
+    def wrap(self, stage: str, func: Callable) -> Callable:
+        """ Returns a wrapper of a callable, which records its calls under the given stage name. """
+
+        stats    = self.stats.setdefault(stage, [0, 0.0])
+        callback = self.callback
+        clock    = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try: 
+                return func(*args, **kwargs)
+            finally:
+                elapsed   = clock() - start
+                stats[0] += 1
+                stats[1] += elapsed
+                if callback is not None: callback(stage, elapsed)
+
+        return timed
+
+
+    def reset(self):
+        """ Resets the statistics of all stages. """
+
+        for stats in self.stats.values(): stats[:] = [0, 0.0]
+
+        return
+
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """ Returns a copy of the statistics of each stage. Nested stages are included in 
+            the time of the stages that call them.
+        """
+
+        return {
+            stage: {
+                'calls'  : calls,
+                'total_s': total,
+                'mean_us': total / calls * 1e6 if calls else 0.0,
+            }
+            for stage, (calls, total) in self.stats.items()
+        }
+
+
+class Timed():
+    """ Proxy of an object whose calls are timed (see StageTimer.wrap()). All other attributes
+        are looked up on the object, unless they are set on the proxy (e.g. timed methods).
+    """
+
+    def __init__(self, obj: Any, call: Callable):
+        """ Initialisation method """
+
+        self.obj  = obj
+        self.call = call
+
+        return
+
+
+    def __call__(self, *args, **kwargs) -> Any: return self.call(*args, **kwargs)
+
+
+    def __getattr__(self, name: str) -> Any: return getattr(self.obj, name)
+
+
+class AliasTable():
+    """ Weighted random selection from a fixed population with Vose's alias method.
+        The table is built once in O(n), after which every selection is O(1).
+        See: https://www.keithschwarz.com/darts-dice-coins/
+    """
+
+    def __init__(self, population: Sequence, weights: Sequence[float]):
+        """ Initialisation method. Builds the probability and alias tables. """
+
+        num   = len(population)
+        total = sum(weights)
+
+        if num == 0 or num != len(weights): raise ValueError('Population and weights must be non-empty and of equal size.')
+        if total <= 0 or min(weights) < 0 : raise ValueError('Weights must be non-negative, with a positive sum.')
+
+        scaled = [w * num / total for w in weights] # Weights scaled to an average of 1
+        prob   = [1.0] * num                        # Probability of keeping the i-th element
+        alias  = list(range(num))                   # Element selected instead of the i-th one
+        small  = [i for i, p in enumerate(scaled) if p <  1.0]
+        large  = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        # Fill the deficit of each under-weighted element with an over-weighted one
+        while small and large:
+            s, l     = small.pop(), large.pop()
+            prob[s]  = scaled[s]
+            alias[s] = l
+            scaled[l] = scaled[l] + scaled[s] - 1.0
+
+            if scaled[l] < 1.0: small.append(l)
+            else              : large.append(l)
+        
+        # Elements left in either list have (up to rounding errors) probability equal to 1
+
+        self.population = tuple(population)
+        self.prob       = prob
+        self.alias      = alias
+
+        return
+
+
+    def __call__(self) -> Any:
+        """ Selects an element of the population. A single random number is used 
+            to select a column of the table and to choose between its two elements.
+        """
+
+        u = rd.random() * len(self.prob)
+        i = int(u)
+
+        return self.population[i] if u - i < self.prob[i] else self.population[self.alias[i]]
+
+
+    def sample(self, k: int) -> List[Any]:
+        """ Makes <k> selections (with replacement) in one go. """
+
+        population, prob, alias, num, random = self.population, self.prob, self.alias, len(self.prob), rd.random
+        
+        out = []
+        for u in (random() * num for _ in range(k)):
+            i = int(u)
+            out.append(population[i] if u - i < prob[i] else population[alias[i]])
 
-        return cls._instances[cls]
+        return out
@@ -13,7 +13,7 @@ setup(
     license="GNU General Public License v3.0",
     python_requires='>=3.10',
     include_package_data = True,
-    packages=find_namespace_packages(),
+    packages=find_namespace_packages(exclude=['benchmarks', 'benchmarks.*']),
     install_requires=["bs4", "requests"],
     keywords=['python', 'headers', 'http'],
     classifiers=[